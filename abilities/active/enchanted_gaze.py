@@ -1,8 +1,7 @@
-import pygame
-import math
 import random
 from abilities.base_ability import ActiveAbility
 from utils.settings import GREEN
+from utils.enemy_snapshot import EnemySnapshot
 
 class EnchantedGaze(ActiveAbility):
     """Olhar Encantado - Encanta inimigos aleatórios próximos, fazendo-os lutar ao seu lado"""
@@ -21,14 +20,8 @@ class EnchantedGaze(ActiveAbility):
             return False
         
         # Find enemies in range
-        enemies_in_range = []
-        for enemy in enemies:
-            distance = math.hypot(
-                enemy.rect.centerx - player.rect.centerx,
-                enemy.rect.centery - player.rect.centery
-            )
-            if distance <= self.charm_radius:
-                enemies_in_range.append(enemy)
+        snapshot = EnemySnapshot.of(enemies)
+        enemies_in_range = snapshot.select(snapshot.in_radius(player.rect.center, self.charm_radius))
         
         if not enemies_in_range:
             return False
@@ -37,13 +30,11 @@ class EnchantedGaze(ActiveAbility):
         charmed_count = min(self.max_charmed, len(enemies_in_range))
         charmed_enemies = random.sample(enemies_in_range, charmed_count)
         
-        current_time = pygame.time.get_ticks()
+        status_effects = kwargs.get('status_effects')
         for enemy in charmed_enemies:
-            enemy.charmed = True
-            enemy.charm_end_time = current_time + self.charm_duration
-            enemy.original_color = enemy.image.get_at((0, 0))  # Store original color
-            # Change color to indicate charm
-            enemy.image.fill(GREEN)
+            if status_effects:
+                # Green indicates the charm
+                status_effects.charm(enemy, self.charm_duration, tint=GREEN)
         
         self.start_cooldown()
         return True
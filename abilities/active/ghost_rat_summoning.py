@@ -3,6 +3,7 @@ import math
 from abilities.base_ability import ActiveAbility
 from entities.projectiles.ability_projectile import AbilityProjectile
 from utils.settings import GREY
+from utils.spatial_hash import nearest_sprite
 
 class GhostRatSummoning(ActiveAbility):
     """Invocação de Ratos Fantasmas - Invoca ratos mágicos que perseguem e atacam inimigos"""
@@ -36,20 +37,16 @@ class GhostRatSummoning(ActiveAbility):
             # Target closest enemy or random direction
             target_x, target_y = player.rect.centerx, player.rect.centery
             if enemies:
-                closest_enemy = min(enemies, key=lambda e: math.hypot(
-                    e.rect.centerx - start_x, e.rect.centery - start_y
-                ))
+                closest_enemy = nearest_sprite(enemies, (start_x, start_y))
                 target_x, target_y = closest_enemy.rect.centerx, closest_enemy.rect.centery
             
-            ghost_rat = AbilityProjectile(
+            projectile_manager.spawn(
+                AbilityProjectile,
                 start_x, start_y, target_x, target_y,
                 speed=3, damage=self.rat_damage,
                 size=(8, 8), color=GREY,
                 homing=True, lifetime=self.rat_lifetime
             )
-            
-            projectile_manager.projectiles.add(ghost_rat)
-            projectile_manager.all_sprites.add(ghost_rat)
         
         self.start_cooldown()
         return True
@@ -1,5 +1,5 @@
-import pygame
 from abilities.base_ability import BuffAbility
+from utils.sim_clock import sim_clock
 
 class PurringShield(BuffAbility):
     """Escudo de Ronronar - Cria uma barreira mágica que da dano a inimigos que encostem"""
@@ -24,7 +24,7 @@ class PurringShield(BuffAbility):
         player.shield_radius = self.shield_radius
         
         self.is_active = True
-        self.activation_time = pygame.time.get_ticks()
+        self.activation_time = sim_clock.now
         self.start_cooldown()
         return True
     
@@ -1,5 +1,5 @@
-import pygame
 from abilities.base_ability import BuffAbility
+from utils.sim_clock import sim_clock
 
 class ReflexAura(BuffAbility):
     """Aura de Reflexos - Aumenta a velocidade de ataque"""
@@ -22,6 +22,6 @@ class ReflexAura(BuffAbility):
         player.projectile_cooldown = int(player.projectile_cooldown * 0.4)
         
         self.is_active = True
-        self.activation_time = pygame.time.get_ticks()
+        self.activation_time = sim_clock.now
         self.start_cooldown()
         return True
@@ -38,15 +38,13 @@ class EtherealFishRain(AreaEffectAbility):
             start_x = target_x + random.randint(-50, 50)
             start_y = -20
             
-            fish = AbilityProjectile(
+            projectile_manager.spawn(
+                AbilityProjectile,
                 start_x, start_y, target_x, target_y,
                 speed=4, damage=self.damage,
                 size=(10, 6), color=CYAN,
                 lifetime=3000
             )
-            
-            projectile_manager.projectiles.add(fish)
-            projectile_manager.all_sprites.add(fish)
         
         self.start_cooldown()
         return True
@@ -1,4 +1,3 @@
-import pygame
 from abilities.base_ability import AreaEffectAbility
 
 class MysticalMeow(AreaEffectAbility):
@@ -23,14 +22,12 @@ class MysticalMeow(AreaEffectAbility):
         )
         
         # Apply stun effect
-        current_time = pygame.time.get_ticks()
+        status_effects = kwargs.get('status_effects')
         for enemy in enemies_in_range:
             enemy.take_damage(self.damage)
-            # Add stun effect
-            enemy.stunned = True
-            enemy.stun_end_time = current_time + self.stun_duration
-            enemy.original_speed = getattr(enemy, 'original_speed', enemy.speed)
-            enemy.speed = 0
+            # Add stun effect, lifted again by the status effect scheduler
+            if status_effects:
+                status_effects.stun(enemy, self.stun_duration)
         
         self.start_cooldown()
         return True
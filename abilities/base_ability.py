@@ -1,10 +1,10 @@
-import pygame
-import math
 from abc import ABC, abstractmethod
 from utils.settings import *
 from entities.player.player import Player
 from entities.enemys.base_enemy import BaseEnemy
 from entities.projectiles.projectile import Projectile
+from utils.enemy_snapshot import EnemySnapshot
+from utils.sim_clock import sim_clock
 class BaseAbility(ABC):
     """
     Abstract base class for all abilities in the game.
@@ -17,7 +17,7 @@ class BaseAbility(ABC):
         self.cooldown = cooldown
         self.level = level
         self.max_level = max_level
-        self.last_used = 0
+        self.last_used = None  # Never used yet, so ready as soon as it's acquired
         self.is_active = False
         self.duration = 0  # For abilities with duration
         self.activation_time = 0
@@ -33,14 +33,15 @@ class BaseAbility(ABC):
         """
         Check if the ability can be activated (cooldown check).
         """
-        current_time = pygame.time.get_ticks()
-        return current_time - self.last_used >= self.cooldown
+        if self.last_used is None:
+            return True
+        return sim_clock.now - self.last_used >= self.cooldown
     
     def start_cooldown(self):
         """
         Start the ability cooldown.
         """
-        self.last_used = pygame.time.get_ticks()
+        self.last_used = sim_clock.now
     
     def upgrade(self):
         """
@@ -65,7 +66,7 @@ class BaseAbility(ABC):
         """
         # Check if timed ability should deactivate
         if self.is_active and self.duration > 0:
-            current_time = pygame.time.get_ticks()
+            current_time = sim_clock.now
             if current_time - self.activation_time >= self.duration:
                 self.deactivate(player, **kwargs)
     
@@ -95,7 +96,7 @@ class PassiveAbility(BaseAbility):
         self.apply_stat_boost(player)
         self.apply_projectile_modifications(player)
         self.is_active = True
-        self.activation_time = pygame.time.get_ticks()
+        self.activation_time = sim_clock.now
         return True
     
     def apply_stat_boost(self, player:Player) -> None:
@@ -205,15 +206,8 @@ class AreaEffectAbility(ActiveAbility):
         """
         Get all enemies within the ability's radius.
         """
-        enemies_in_range = []
-        for enemy in enemies:
-            distance = math.hypot(
-                enemy.rect.centerx - center_x,
-                enemy.rect.centery - center_y
-            )
-            if distance <= self.radius:
-                enemies_in_range.append(enemy)
-        return enemies_in_range
+        snapshot = EnemySnapshot.of(enemies)
+        return snapshot.select(snapshot.in_radius((center_x, center_y), self.radius))
     
     def on_upgrade(self):
         """
@@ -241,5 +235,5 @@ class BuffAbility(BaseAbility):
                 new_value = getattr(player, stat_name) * self.buff_effects[stat_name]
                 setattr(player, stat_name, new_value)
         self.is_active = True
-        self.activation_time = pygame.time.get_ticks()
+        self.activation_time = sim_clock.now
         return True
@@ -11,7 +11,6 @@ class CatnipSpell(PassiveAbility):
             'particles': 'catnip_trail',  # Not working for now
             'size': (6, 6),
             'spritesheet': 'assets/images/abilities/plant/Planta.png',
-            'sprite_frame_delay': 100,
         }
         
         super().__init__(
@@ -10,7 +10,6 @@ class CleaningTongue(PassiveAbility):
             'particles': 'healing_trail',  # Not working for now
             'size': (7, 7),
             'spritesheet': 'assets/images/abilities/water/Water.png',
-            'sprite_frame_delay': 100,
         }
 
         super().__init__(
@@ -14,7 +14,6 @@ class FrozenClaw(PassiveAbility):
             'particles': 'ice_trail', # Not working for now
             'size': (7, 7),
             'spritesheet':'assets/images/abilities/ice/Gelo.png',
-            'sprite_frame_delay': 100, 
         }
         
         super().__init__(
@@ -12,7 +12,6 @@ class Pawquake(PassiveAbility):
             'particles': 'knockback_trail',  # Placeholder for knockback particles
             'size': (7, 7),
             'spritesheet': 'assets/images/abilities/earth/Terra.png',
-            'sprite_frame_delay': 100,
         }
         
         super().__init__(
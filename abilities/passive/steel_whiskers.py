@@ -12,7 +12,6 @@ class SteelWhiskers(PassiveAbility):
             'particles': 'piercing_trail',  # Placeholder for piercing particles
             'size': (8, 8),
             'spritesheet': 'assets/images/abilities/metal/Metal.png',
-            'sprite_frame_delay': 50,
         }
         
         super().__init__(
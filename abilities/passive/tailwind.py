@@ -12,7 +12,6 @@ class Tailwind(PassiveAbility):
             'particles': 'tailwind_trail',
             'size': (5, 5),
             'spritesheet': 'assets/images/abilities/air/Ar.png',
-            'sprite_frame_delay': 75,
         }
         
         super().__init__(
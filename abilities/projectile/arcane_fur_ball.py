@@ -26,20 +26,18 @@ class ArcaneFurBall(ProjectileAbility):
         # Target random enemy
         target_enemy = random.choice(list(enemies))
         
-        projectile = SpecialProjectile(
-            player.rect.centerx, player.rect.centery,
-            target_enemy.rect.centerx, target_enemy.rect.centery,
-            projectile_type="fur_ball",
-            speed=self.speed, damage=self.damage,
-            size=self.size, color=self.color,
-            explosion_radius=self.explosion_radius
-        )
-        
         # Add to projectile manager
         projectile_manager = kwargs.get('projectile_manager')
         if projectile_manager:
-            projectile_manager.projectiles.add(projectile)
-            projectile_manager.all_sprites.add(projectile)
+            projectile_manager.spawn(
+                SpecialProjectile,
+                player.rect.centerx, player.rect.centery,
+                target_enemy.rect.centerx, target_enemy.rect.centery,
+                projectile_type="fur_ball",
+                speed=self.speed, damage=self.damage,
+                size=self.size, color=self.color,
+                explosion_radius=self.explosion_radius
+            )
         
         self.start_cooldown()
         return True
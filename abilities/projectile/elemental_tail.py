@@ -18,11 +18,15 @@ class ElementalTail(ProjectileAbility):
         )
         self.elements = ['fire', 'ice', 'lightning']
         self.current_element = 0
+        # Scheduler the elemental effects are applied through, set on activation
+        self.status_effects = None
     
     def activate(self, player, enemies=None, **kwargs):
         if not self.can_activate():
             return False
         
+        self.status_effects = kwargs.get('status_effects')
+
         # Get player's last movement direction (simplified - opposite of center)
         keys = kwargs.get('keys', [])
         direction_x, direction_y = 0, 1  # Default downward
@@ -46,28 +50,26 @@ class ElementalTail(ProjectileAbility):
         element = self.elements[self.current_element]
         element_colors = {'fire': RED, 'ice': CYAN, 'lightning': YELLOW}
         
-        projectile = SpecialProjectile(
-            player.rect.centerx, player.rect.centery,
-            target_x, target_y,
-            projectile_type="whisker_beam",
-            speed=self.speed, damage=self.damage,
-            size=self.size, color=element_colors[element],
-            piercing=True, lifetime=1500
-        )
-        
         # Add elemental effect
         if element == 'fire':
-            projectile.effects = [self.burn_effect]
+            effects = [self.burn_effect]
         elif element == 'ice':
-            projectile.effects = [self.freeze_effect]
+            effects = [self.freeze_effect]
         elif element == 'lightning':
-            projectile.effects = [self.shock_effect]
+            effects = [self.shock_effect]
         
         # Add to projectile manager
         projectile_manager = kwargs.get('projectile_manager')
         if projectile_manager:
-            projectile_manager.projectiles.add(projectile)
-            projectile_manager.all_sprites.add(projectile)
+            projectile_manager.spawn(
+                SpecialProjectile,
+                player.rect.centerx, player.rect.centery,
+                target_x, target_y,
+                projectile_type="whisker_beam",
+                speed=self.speed, damage=self.damage,
+                size=self.size, color=element_colors[element],
+                piercing=True, lifetime=1500, effects=effects
+            )
         
         # Cycle through elements
         self.current_element = (self.current_element + 1) % len(self.elements)
@@ -76,18 +78,15 @@ class ElementalTail(ProjectileAbility):
     
     def burn_effect(self, enemy):
         """Apply burn damage over time"""
-        enemy.burning = True
-        enemy.burn_end_time = pygame.time.get_ticks() + 3000
-        enemy.burn_damage = 5
+        if self.status_effects:
+            self.status_effects.burn(enemy, 3000, 5)
     
     def freeze_effect(self, enemy):
         """Apply freeze effect"""
-        enemy.frozen = True
-        enemy.freeze_end_time = pygame.time.get_ticks() + 2000
-        enemy.original_speed = getattr(enemy, 'original_speed', enemy.speed)
-        enemy.speed = 0
+        if self.status_effects:
+            self.status_effects.freeze(enemy, 2000)
     
     def shock_effect(self, enemy):
         """Apply shock effect that spreads to nearby enemies"""
-        enemy.shocked = True
-        enemy.shock_end_time = pygame.time.get_ticks() + 1000
+        if self.status_effects:
+            self.status_effects.shock(enemy, 1000)
@@ -3,6 +3,7 @@ import math
 from abilities.base_ability import ProjectileAbility
 from entities.projectiles.ability_projectile import SpecialProjectile
 from utils.settings import YELLOW
+from utils.spatial_hash import nearest_sprite
 
 class WhiskerBeam(ProjectileAbility):
     """Raio de Bigodes - Dispara feixes mágicos dos bigodes causando dano à distância"""
@@ -23,33 +24,21 @@ class WhiskerBeam(ProjectileAbility):
             return False
         
         # Find closest enemy
-        closest_enemy = None
-        min_distance = float('inf')
-        
-        for enemy in enemies:
-            distance = math.hypot(
-                enemy.rect.centerx - player.rect.centerx,
-                enemy.rect.centery - player.rect.centery
-            )
-            if distance < min_distance:
-                min_distance = distance
-                closest_enemy = enemy
+        closest_enemy = nearest_sprite(enemies, player.rect.center)
         
         if closest_enemy:
-            projectile = SpecialProjectile(
-                player.rect.centerx, player.rect.centery,
-                closest_enemy.rect.centerx, closest_enemy.rect.centery,
-                projectile_type="whisker_beam",
-                speed=self.speed, damage=self.damage,
-                size=self.size, color=self.color,
-                piercing=True, lifetime=2000
-            )
-            
             # Add to projectile manager if available
             projectile_manager = kwargs.get('projectile_manager')
             if projectile_manager:
-                projectile_manager.projectiles.add(projectile)
-                projectile_manager.all_sprites.add(projectile)
+                projectile_manager.spawn(
+                    SpecialProjectile,
+                    player.rect.centerx, player.rect.centery,
+                    closest_enemy.rect.centerx, closest_enemy.rect.centery,
+                    projectile_type="whisker_beam",
+                    speed=self.speed, damage=self.damage,
+                    size=self.size, color=self.color,
+                    piercing=True, lifetime=2000
+                )
             
             self.start_cooldown()
             return True
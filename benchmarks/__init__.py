@@ -0,0 +1,4 @@
+"""
+Fixed stress scenarios for measuring the game's per-tick cost.
+Run them with `python -m benchmarks.run` from the project root.
+"""
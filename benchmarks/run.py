@@ -0,0 +1,145 @@
+"""
+Run the benchmark scenarios and compare them with a stored baseline.
+
+Every scenario plays a fresh, seeded game on the fixed-mode clock with the
+player kept alive, and records the milliseconds each subsystem takes per
+tick. The median and p99 of each are printed and, with --save, written as
+the baseline; otherwise they are compared with the baseline and the run
+fails if any median got slower than the tolerance allows.
+
+Usage (from the project root):
+    python -m benchmarks.run --save          # record a baseline on this machine
+    python -m benchmarks.run                 # compare against it
+    python -m benchmarks.run --scenario chasers_500 --ticks 600
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+# No window and no sound
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+from game_controller import GameController
+from utils.frame_timer import FrameTimer
+from utils.bot_input import BotInput
+from utils.sim_clock import SimClock, sim_clock
+from benchmarks.scenarios import SCENARIOS, Scenario
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+# Subsystems reported, each the sum of these FrameTimer spans per tick
+SUBSYSTEMS = {
+    'enemies': ('enemies',),
+    'projectiles': ('projectiles',),
+    'collisions': ('collide_projectile_enemy', 'collide_projectile_player', 'collide_enemy_player',
+                   'collide_experience'),
+    'abilities': ('abilities',),
+    'render': ('render',),
+}
+
+
+def run_scenario(scenario:Scenario, ticks:int, warmup:int, seed:int = 0) -> dict:
+    """Play the scenario and return {subsystem: {'median': ms, 'p99': ms}}"""
+    random.seed(seed)
+    sim_clock.configure(SimClock.FIXED)
+    game = GameController(db_path=":memory:")
+    game.interpolator = None
+    game.dirty_renderer = None
+    game.input_source = BotInput('idle')
+    game.frame_timer = FrameTimer(keep_samples=True)
+    state = game.state_manager
+    state.change_state(state.PLAYING)
+    scenario.setup(game)
+
+    for tick in range(warmup + ticks):
+        if tick == warmup:
+            game.frame_timer.reset()
+        # Level ups and deaths would stop the game, ignore them
+        state.change_state(state.PLAYING)
+        game.player.hp = game.player.max_hp
+        scenario.refill(game)
+
+        game.update_game_state()
+        game.render_screen()
+        game.frame_timer.end_frame()
+
+    samples = game.frame_timer.samples
+    results = {}
+    for subsystem, spans in SUBSYSTEMS.items():
+        per_tick = np.sum([samples[span] for span in spans], axis=0)
+        results[subsystem] = {
+            'median': round(float(np.median(per_tick)), 4),
+            'p99': round(float(np.percentile(per_tick, 99)), 4),
+        }
+    return results
+
+
+def compare(results:dict, baseline:dict, tolerance:float, noise_ms:float) -> list[str]:
+    """Regressions of the results' medians against the baseline, as messages"""
+    regressions = []
+    for name, subsystems in results.items():
+        for subsystem, current in subsystems.items():
+            previous = baseline.get(name, {}).get(subsystem)
+            if previous is None:
+                continue
+            limit = previous['median'] * (1 + tolerance)
+            # Sub-noise differences on tiny phases are not regressions
+            if current['median'] > limit and current['median'] - previous['median'] > noise_ms:
+                regressions.append(f"{name}/{subsystem}: median {current['median']:.3f} ms "
+                                   f"vs baseline {previous['median']:.3f} ms")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the benchmark scenarios.")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument('--ticks', type=int, default=300, help="measured ticks per scenario")
+    parser.add_argument('--warmup', type=int, default=60, help="ticks run before measuring")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument('--save', action='store_true', help="store the results as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown of a median before it counts as a regression")
+    parser.add_argument('--noise-ms', type=float, default=0.05,
+                        help="ignore slowdowns smaller than this many ms")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        scenario = SCENARIOS[name]
+        print(f"{name}: {scenario.description}")
+        results[name] = run_scenario(scenario, args.ticks, args.warmup, args.seed)
+        for subsystem, stats in results[name].items():
+            print(f"  {subsystem:<12} median {stats['median']:8.3f} ms   p99 {stats['p99']:8.3f} ms")
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(args.baseline, 'w') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save to record one")
+        return
+    with open(args.baseline) as file:
+        regressions = compare(results, json.load(file), args.tolerance, args.noise_ms)
+    if regressions:
+        print("Performance regressions:")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+    print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import random
+from typing import Callable, Optional
+from entities.enemys.enemy import Enemy
+from entities.enemys.triangle_enemy import TriangleEnemy
+from entities.enemys.big_square import BigSquare
+from entities.projectiles.projectile import Projectile
+
+
+class Scenario:
+    """
+    A canned load: setup() fills a fresh game, refill() runs before every tick
+    to keep the load constant (enemies get killed, projectiles fly off).
+    """
+    def __init__(self, name:str, description:str, setup:Callable[["GameController"], None],
+                 refill:Optional[Callable[["GameController"], None]] = None) -> None:
+        self.name = name
+        self.description = description
+        self.setup = setup
+        self.refill = refill or setup
+
+
+def top_up_enemies(game, enemy_class:type, count:int) -> None:
+    """Spawn enemies of enemy_class at the screen edges until there are count of them"""
+    manager = game.enemy_manager
+    alive = sum(1 for enemy in manager.enemies if type(enemy) is enemy_class)
+    for _ in range(count - alive):
+        manager.add_enemy(enemy_class(game.player, screen_width=game.width, screen_height=game.height))
+
+
+def chasers(game) -> None:
+    top_up_enemies(game, Enemy, 500)
+
+
+def shooters(game) -> None:
+    top_up_enemies(game, TriangleEnemy, 50)
+
+
+def boss_with_passives(game) -> None:
+    for ability in ('static_fur', 'steel_whiskers', 'flaming_paws'):
+        game.ability_manager.acquire_magical_ability(ability)
+    boss_refill(game)
+
+
+def boss_refill(game) -> None:
+    manager = game.enemy_manager
+    if not manager.boss:
+        boss = BigSquare(game.player, screen_width=game.width, screen_height=game.height)
+        manager.boss.add(boss)
+        manager.add_enemy(boss)
+        manager.is_boss_alive = True
+    top_up_enemies(game, Enemy, 100)
+
+
+def projectiles(game) -> None:
+    """2,000 player projectiles flying out of the screen center in random directions"""
+    manager = game.projectile_manager
+    cx, cy = game.width / 2, game.height / 2
+    for _ in range(2000 - len(manager.player_projectiles)):
+        projectile = manager.acquire(
+            Projectile, cx, cy, cx + random.uniform(-1, 1), cy + random.uniform(-1, 1),
+            screen_width=game.width, screen_height=game.height,
+        )
+        manager.player_projectiles.add(projectile)
+        manager.add_projectile(projectile)
+    # A few targets so collisions have work to do
+    top_up_enemies(game, Enemy, 20)
+
+
+SCENARIOS = {scenario.name: scenario for scenario in (
+    Scenario('chasers_500', "500 chasing rats", chasers),
+    Scenario('shooters_50', "50 TriangleEnemy shooters", shooters),
+    Scenario('boss_passives', "Boss and 100 rats against StaticFur, SteelWhiskers and FlamingPaws",
+             boss_with_passives, boss_refill),
+    Scenario('projectiles_2000', "2,000 player projectiles and 20 rats", projectiles),
+)}
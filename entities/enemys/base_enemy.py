@@ -4,11 +4,28 @@ import math
 from utils.settings import *
 from entities.experience.experience import Experience
 from entities.player.player import Player
+from utils.asset_cache import AssetCache
+from utils.transform_cache import transform_cache
+from utils.array_field import ArrayField
+from entities.enemys.status_effects import StatusEffects
 from typing import Optional, Tuple
 import math
+from utils.sim_clock import sim_clock
 class BaseEnemy(pygame.sprite.Sprite):
     """Base class for all enemies in the game."""
 
+    # Chase enemies are moved by the EnemyManager's EnemySwarm; enemies with
+    # their own movement (e.g. TriangleEnemy) set this to False
+    swarm_movement = True
+
+    # Simulation state, kept in the swarm's arrays while attached to one
+    pos_x = ArrayField('pos', column=0, store='swarm')
+    pos_y = ArrayField('pos', column=1, store='swarm')
+    speed = ArrayField('speed', store='swarm')
+    hp = ArrayField('hp', store='swarm')
+    frozen = ArrayField('frozen', cast=bool, store='swarm')
+    charmed = ArrayField('charmed', cast=bool, store='swarm')
+
     def __init__(self, 
         player:Player, 
         size:Tuple[int, int, int], 
@@ -25,19 +42,29 @@ class BaseEnemy(pygame.sprite.Sprite):
     ) -> None:
         super().__init__()
 
+        # Not part of a swarm until the EnemyManager adds it to one
+        self.swarm = None
+        self.swarm_slot = -1
+        self.swarm_moved = False  # whether the last EnemySwarm.step moved it
+        self.frozen = False
+        self.charmed = False
+        # Stun, burn, shock and what freezes and charms need to undo themselves
+        self.status = StatusEffects(self)
+
         # Create enemy sprite with specified size and color
         if spritesheet:
             try:
-                self.sheet = pygame.transform.scale(pygame.image.load(spritesheet).convert_alpha(), size)
-                frame_width = self.sheet.get_width() // frame_ammount
-                frame_height = self.sheet.get_height()
-                self.run_frames = [
-                    pygame.transform.scale(self.sheet.subsurface((i * frame_width, 0, frame_width, frame_height)), size)
-                    for i in range(frame_ammount)
-                ]
+                # Frame count and delay come from the sheet's animation data unless given
+                if frame_ammount is None or frame_delay is None:
+                    animation = AssetCache.get_animation(spritesheet)
+                    frame_ammount = frame_ammount if frame_ammount is not None else animation['frames']
+                    frame_delay = frame_delay if frame_delay is not None else animation['frame_delay']
+                # Frames are shared between all enemies using the same sheet
+                self.sheet = spritesheet
+                self.run_frames = AssetCache.get_frames(spritesheet, size, frame_ammount)
                 self.current_frame = 0
                 self.frame_timer = 0
-                self.frame_delay = frame_delay  # Default to 100ms
+                self.frame_delay = frame_delay
                 self.image = self.run_frames[0]
                 if frame_ammount > 1:
                     self.has_animation = True
@@ -80,7 +107,23 @@ class BaseEnemy(pygame.sprite.Sprite):
         self.pos_y = float(self.rect.y)
         self.rect.center = (self.pos_x, self.pos_y)
         self.base_height = self.image.get_height()
-        self.mask = pygame.mask.from_surface(self.image)
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Collision mask of the current image, only built when a collision check needs it"""
+        return AssetCache.get_mask(self.image)
+
+    def attach_swarm(self, swarm, slot:int) -> None:
+        """Called by EnemySwarm.add once the state was copied into its arrays"""
+        self.swarm = swarm
+        self.swarm_slot = slot
+
+    def detach_swarm(self) -> None:
+        """Copy the state back from the swarm's arrays before leaving it"""
+        state = (self.pos_x, self.pos_y, self.speed, self.hp, self.frozen, self.charmed)
+        self.swarm = None
+        self.swarm_slot = -1
+        self.pos_x, self.pos_y, self.speed, self.hp, self.frozen, self.charmed = state
 
     def spawn_at_screen_edge(self) -> None:
         """Spawn enemy at random edge of screen"""
@@ -97,13 +140,12 @@ class BaseEnemy(pygame.sprite.Sprite):
 
     def update(self, *args, **kwargs) -> Optional[int]:
         """Move enemy towards player, now accepts any arguments"""
-            # Check for status effects that prevent movement
-        if hasattr(self, 'frozen') and self.frozen:
-            return 0
-        
-        # Handle charmed enemies (attack other enemies instead)
-        if hasattr(self, 'charmed') and self.charmed:
-            self.update_charmed_behavior()
+        # Swarm enemies were already moved by EnemySwarm.step
+        if self.swarm is not None:
+            return None if self.swarm_moved else 0
+
+        # Check for status effects that prevent movement
+        if self.frozen or self.charmed:
             return 0
         
         # Calculate direction to player
@@ -133,40 +175,35 @@ class BaseEnemy(pygame.sprite.Sprite):
         """Check if the enemy can shoot based on cooldown"""
         if not self.shooter:
             return False
-        return pygame.time.get_ticks() - self.last_shot > self.projectile_cooldown
+        return sim_clock.now - self.last_shot > self.projectile_cooldown
 
     def kill(self, ammount) -> Experience:
         """Handle enemy death"""
         xp = Experience(self.player, self.rect.x, self.rect.y, ammount)
+        if self.swarm is not None:
+            self.swarm.remove(self)
         super().kill()
         return xp
     
     def update_animation_rotation(self) -> None:
         if hasattr(self, 'has_animation') and self.has_animation:
-            now = pygame.time.get_ticks()
+            now = sim_clock.now
             if now - self.frame_timer >= self.frame_delay:
                 self.current_frame = (self.current_frame + 1) % len(self.run_frames)
                 self.frame_timer = now
-                self.image = self.run_frames[self.current_frame]
-        else:
-            if self.angle is not None:
-                center = self.rect.center
-                self.image = pygame.transform.rotate(self.image, self.angle)
-                self.rect = self.image.get_rect(center=center)
-            if hasattr(self, 'sheet') and self.sheet:
-                self.image = self.run_frames[0]
-                self.current_frame = 0
+        elif hasattr(self, 'sheet') and self.sheet:
+            self.current_frame = 0
+        frame = self.run_frames[self.current_frame]
         if self.angle is not None:
             center = self.rect.center
-            self.image = pygame.transform.rotate(self.run_frames[self.current_frame], self.angle+90)
+            self.image = transform_cache.get(frame, self.angle + 90)
             self.rect = self.image.get_rect(center=center)
         else:
-            self.image = self.run_frames[self.current_frame]
-        self.mask = pygame.mask.from_surface(self.image)
+            self.image = frame
 
     def update_animation_turning(self) -> None:
         if hasattr(self, 'has_animation') and self.has_animation:
-            now = pygame.time.get_ticks()
+            now = sim_clock.now
             if now - self.frame_timer >= self.frame_delay:
                 self.current_frame = (self.current_frame + 1) % len(self.run_frames)
                 self.frame_timer = now
@@ -177,13 +214,12 @@ class BaseEnemy(pygame.sprite.Sprite):
                 self.current_frame = 0
         if not (self.angle > 90 or self.angle < -90):  # Only flip if not facing left:
                     center = self.rect.center
-                    self.image = pygame.transform.flip(self.run_frames[self.current_frame], True, False)
+                    self.image = transform_cache.get(self.run_frames[self.current_frame], flip=True)
                     self.rect = self.image.get_rect(center=center)
-        self.mask = pygame.mask.from_surface(self.image)
 
     def update_animation_turning_rotation(self) -> None:
         if hasattr(self, 'has_animation') and self.has_animation:
-            now = pygame.time.get_ticks()
+            now = sim_clock.now
             if now - self.frame_timer >= self.frame_delay:
                 self.current_frame = (self.current_frame + 1) % len(self.run_frames)
                 self.frame_timer = now
@@ -196,15 +232,12 @@ class BaseEnemy(pygame.sprite.Sprite):
             if  -90 < self.angle < 90:
                 flip = True
 
-        if flip:
-            frame = pygame.transform.flip(frame, True, False)
-        else:
+        if not flip:
             angle = angle+180
 
         if self.angle is not None:
-            frame = pygame.transform.rotate(frame, angle)
+            frame = transform_cache.get(frame, angle, flip)
 
         center = self.rect.center
         self.image = frame
         self.rect = self.image.get_rect(center=center)
-        self.mask = pygame.mask.from_surface(self.image)
\ No newline at end of file
@@ -1,7 +1,7 @@
-import pygame
 from entities.enemys.base_enemy import BaseEnemy
 from entities.player.player import Player
 from typing import Optional, Tuple
+from utils.sim_clock import sim_clock
 class BaseShooter(BaseEnemy):
     """Base class for shooter enemies that can shoot projectiles"""
     def __init__(self, 
@@ -39,6 +39,6 @@ class BaseShooter(BaseEnemy):
 
         self.projectile_damage = projectile_damage
         self.projectile_cooldown = projectile_cooldown
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = sim_clock.now
         self.projectile_modifications = {}
         
\ No newline at end of file
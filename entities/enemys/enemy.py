@@ -31,8 +31,6 @@ class Enemy(BaseEnemy):
             screen_width=screen_width, 
             screen_height=screen_height,
             spritesheet='assets/images/enemys/rat/Rato.png',
-            frame_ammount=2,  # Number of frames in the sprite sheet
-            frame_delay=150,
         )
 
     def update(self, *args, **kwargs) -> None:
@@ -31,8 +31,6 @@ class FastEnemy(BaseEnemy):
             screen_width=screen_width,
             screen_height=screen_height,
             spritesheet='assets/images/enemys/bird/Pombo.png',
-            frame_ammount=2,  # Number of frames in the sprite sheet
-            frame_delay=100
         )
 
     def kill(self) -> Experience:
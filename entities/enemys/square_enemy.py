@@ -31,8 +31,6 @@ class SquareEnemy(BaseEnemy):
             screen_width=screen_width,
             screen_height=screen_height,
             spritesheet='assets/images/enemys/dog/Cachorro.png',
-            frame_ammount=2,
-            frame_delay=200
         )
 
     def kill(self) -> Experience:
@@ -0,0 +1,99 @@
+import pygame
+from typing import Optional, Tuple
+
+
+class StatusEffects:
+    """
+    Status effect state of one enemy, kept in fixed slots instead of ad hoc
+    attributes on the sprite. Frozen and charmed are read from the enemy
+    itself, since the EnemySwarm keeps those flags in its arrays; everything
+    else lives here. Timing is the StatusEffectScheduler's job.
+    """
+    __slots__ = ('enemy', 'stunned', 'burning', 'shocked', 'burn_damage', 'original_speed', 'uncharmed_image')
+
+    def __init__(self, enemy: pygame.sprite.Sprite) -> None:
+        self.enemy = enemy
+        self.stunned = False
+        self.burning = False
+        self.shocked = False
+        self.burn_damage = 0.0
+        self.original_speed: Optional[float] = None  # speed to restore once it can move again
+        self.uncharmed_image: Optional[pygame.Surface] = None  # image from before the charm tint
+
+    @property
+    def frozen(self) -> bool:
+        return self.enemy.frozen
+
+    @property
+    def charmed(self) -> bool:
+        return self.enemy.charmed
+
+    @property
+    def immobile(self) -> bool:
+        """Whether freeze or stun is holding the enemy in place"""
+        return self.enemy.frozen or self.stunned
+
+    def _hold(self) -> None:
+        if self.original_speed is None:
+            self.original_speed = self.enemy.speed
+        self.enemy.speed = 0
+
+    def _release(self) -> None:
+        if not self.immobile and self.original_speed is not None:
+            self.enemy.speed = self.original_speed
+            self.original_speed = None
+
+    def freeze(self) -> None:
+        self.enemy.frozen = True
+        self._hold()
+
+    def unfreeze(self) -> None:
+        self.enemy.frozen = False
+        self._release()
+
+    def stun(self) -> None:
+        self.stunned = True
+        self._hold()
+
+    def unstun(self) -> None:
+        self.stunned = False
+        self._release()
+
+    def ignite(self, damage: float) -> None:
+        self.burning = True
+        self.burn_damage = damage
+
+    def extinguish(self) -> None:
+        self.burning = False
+
+    def charm(self, tint: Optional[Tuple[int, int, int]] = None) -> None:
+        """Charm the enemy, showing it filled with tint if given"""
+        enemy = self.enemy
+        enemy.charmed = True
+        if tint is not None:
+            if self.uncharmed_image is None:
+                self.uncharmed_image = enemy.image
+            # Frames are shared, so tint a copy
+            enemy.image = enemy.image.copy()
+            enemy.image.fill(tint)
+
+    def uncharm(self) -> None:
+        # Animated enemies redraw on their next frame anyway
+        self.enemy.charmed = False
+        if self.uncharmed_image is not None:
+            self.enemy.image = self.uncharmed_image
+            self.uncharmed_image = None
+
+    def shock(self) -> None:
+        self.shocked = True
+
+    def unshock(self) -> None:
+        self.shocked = False
+
+    def clear(self) -> None:
+        """Lift every effect"""
+        self.unfreeze()
+        self.unstun()
+        self.extinguish()
+        self.uncharm()
+        self.unshock()
@@ -9,6 +9,9 @@ from entities.experience.experience import Experience
 
 class TriangleEnemy(BaseShooter):
     """A enemy that keeps a distance from the player and shoots projectiles"""
+    # Keeps its distance instead of chasing, so it moves itself
+    swarm_movement = False
+
     def __init__(self, 
         player: Player, 
         x: Optional[float] = None, 
@@ -36,14 +39,11 @@ class TriangleEnemy(BaseShooter):
             projectile_cooldown=projectile_cooldown,
             projectile_damage=projectile_damage,
             spritesheet='assets/images/enemys/bottle_spray/Pshpsh.png',
-            frame_ammount=2,  # Number of frames in the sprite sheet
-            frame_delay=200,
         )
         self.pos_x = float(self.rect.x)
         self.pos_y = float(self.rect.y)
         self.projectile_modifications = {
             'spritesheet': 'assets/images/enemys/bottle_spray/Projetil.png',
-            'sprite_frame_delay': 150,
         }
 
     def update(self, *args, **kwargs) -> None:
@@ -1,19 +1,43 @@
 import pygame
 from entities.player.player import Player
 from typing import Optional
-class Experience(pygame.sprite.Sprite):
-    """Class representing experience points in the game."""
-    
+class Experience:
+    """
+    Experience orb dropped by a dead enemy.
+    Orbs are plain slotted objects kept in a list by the ExperienceManager
+    rather than sprites, and all of them share one pre-filled surface.
+    """
+    __slots__ = ('player', 'rect', 'value')
+
+    SIZE = (5, 5)
+    COLOR = (255, 215, 0)  # Gold color for experience
+    _surface: Optional[pygame.Surface] = None
+    _mask: Optional[pygame.mask.Mask] = None
+
     def __init__(self, player: Player, x: float, y: float, value: Optional[int] = 10) -> None:
-        super().__init__()
-        self.image = pygame.Surface((5, 5))
-        self.image.fill((255, 215, 0))  # Gold color for experience
-        self.rect = self.image.get_rect(center=(x, y))
+        self.rect = pygame.Rect((0, 0), self.SIZE)
+        self.rect.center = (x, y)
         self.value = value
         self.player = player
-        
 
-    def kill(self) -> None:
-        """Override kill to add experience to player"""
+    @classmethod
+    def surface(cls) -> pygame.Surface:
+        """The surface every orb is drawn with, created on first use"""
+        if cls._surface is None:
+            cls._surface = pygame.Surface(cls.SIZE)
+            cls._surface.fill(cls.COLOR)
+            cls._mask = pygame.mask.from_surface(cls._surface)
+        return cls._surface
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self.surface()
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        self.surface()
+        return self._mask
+
+    def collect(self) -> None:
+        """Give the orb's experience to the player"""
         self.player.gain_exp(self.value)
-        super().kill()
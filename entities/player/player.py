@@ -1,24 +1,23 @@
 import pygame
 from utils.settings import *
+from utils.asset_cache import AssetCache
+from utils.transform_cache import transform_cache
 from typing import Optional, Callable
+from utils.sim_clock import sim_clock
+
+PLAYER_STAND_SPRITE = 'assets/images/kitty/Gatinho.png'
+PLAYER_RUN_SPRITESHEET = 'assets/images/kitty/Gatinho Correndo.png'
+
 class Player(pygame.sprite.Sprite):
     def __init__(self, x: float, y: float, screen_width: Optional[float]=None, screen_height: Optional[float]=None)->None:
         super().__init__()
         # Imagem parada
-        self.stand_image = pygame.transform.scale(
-            pygame.image.load('assets/images/kitty/Gatinho.png').convert_alpha(), (100, 100)
-        )
-        # Carrega frames do spritesheet (2 colunas)
-        sheet = pygame.image.load('assets/images/kitty/Gatinho Correndo.png').convert_alpha()
-        frame_width = sheet.get_width() // 2
-        frame_height = sheet.get_height()
-        self.run_frames = [
-            pygame.transform.scale(sheet.subsurface((i * frame_width, 0, frame_width, frame_height)), (100, 100))
-            for i in range(2)
-        ]
+        self.stand_image = AssetCache.get_animation_frames(PLAYER_STAND_SPRITE)[0]
+        # Frames do spritesheet de corrida (compartilhados via AssetCache)
+        self.run_frames = AssetCache.get_animation_frames(PLAYER_RUN_SPRITESHEET)
         self.current_frame = 0
         self.frame_timer = 0
-        self.frame_delay = 150  # ms por frame
+        self.frame_delay = AssetCache.get_animation(PLAYER_RUN_SPRITESHEET)['frame_delay']  # ms por frame
         self.facing_right = True
         self.image = self.stand_image
         self.rect = self.image.get_rect()
@@ -31,14 +30,18 @@ class Player(pygame.sprite.Sprite):
         self.level = 1
         self.exp = 0
         self.projectile_cooldown = 500  # milliseconds
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = sim_clock.now
         self.level_up_callback = None  # Add callback for level up
         self.projectile_damage = 10  # Base projectile damage
-        self.last_hit_time = 0  # Track last hit time for invincibility
+        self.last_hit_time = -PLAYER_INVICIBILITY_TIME  # Track last hit time for invincibility (none at the start)
         # Store actual screen dimensions
         self.screen_width = screen_width if screen_width is not None else SCREEN_WIDTH
         self.screen_height = screen_height if screen_height is not None else SCREEN_HEIGHT
-        self.mask = pygame.mask.from_surface(self.image)
+
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Collision mask of the current image, only built when a collision check needs it"""
+        return AssetCache.get_mask(self.image)
 
     def move(self, keys:pygame.key.ScancodeWrapper) -> None:
         """Move the player based on keyboard input"""
@@ -102,7 +105,7 @@ class Player(pygame.sprite.Sprite):
 
     def can_shoot(self) -> bool:
         """Check if player can shoot a projectile"""
-        now = pygame.time.get_ticks()
+        now = sim_clock.now
         return now - self.last_shot > self.projectile_cooldown
 
     def update(self, keys: pygame.key.ScancodeWrapper) -> None:
@@ -110,16 +113,15 @@ class Player(pygame.sprite.Sprite):
         self.move(keys)
 
     def update_animation(self, moving:bool) -> None:
-        now = pygame.time.get_ticks()
+        now = sim_clock.now
         if moving:
             if now - self.frame_timer > self.frame_delay:
                 self.current_frame = (self.current_frame + 1) % len(self.run_frames)
                 self.frame_timer = now
             frame = self.run_frames[self.current_frame]
             if self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
+                frame = transform_cache.get(frame, flip=True)
             self.image = frame
         else:
             self.image = self.stand_image
         self.rect = self.image.get_rect(center=self.rect.center)
-        self.mask = pygame.mask.from_surface(self.image)
@@ -3,11 +3,27 @@ import math
 from utils.settings import *
 from typing import Tuple, Optional
 from entities.enemys.base_enemy import BaseEnemy
+from utils.spatial_hash import nearest_sprite
+from utils.array_field import ArrayField
+from utils.sim_clock import sim_clock
 class AbilityProjectile(pygame.sprite.Sprite):
     """
     Projectile class specifically for abilities, with more customization options.
     """
-    def __init__(self, 
+    # Culled once the rect is fully this far outside the screen
+    cull_margin = 50
+
+    # Velocity, kept in the ProjectileStore's arrays while attached to one
+    dx = ArrayField('vel', column=0)
+    dy = ArrayField('vel', column=1)
+
+    # Plain colored squares shared by every projectile of the same size and color
+    _images: dict[tuple, pygame.Surface] = {}
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.reset(*args, **kwargs)
+
+    def reset(self, 
         x: float, 
         y: float, 
         target_x: float, 
@@ -24,13 +40,25 @@ class AbilityProjectile(pygame.sprite.Sprite):
         homing: Optional[bool] = False, 
         effects: Optional[list] = None
         ) -> None:
-        super().__init__()
+        """(Re)initialize the projectile in place, so pooled instances can be reused"""
+        # Drop everything from a previous life (e.g. piercing state set by collisions)
+        self.__dict__.clear()
+        pygame.sprite.Sprite.__init__(self)
+        self.pool = None
+        
+        # Not part of a store until the ProjectileManager adds it to one
+        self.store = None
+        self.store_slot = -1
         
         # Visual properties
         self.size = size
         self.color = color
-        self.image = pygame.Surface(size)
-        self.image.fill(color)
+        key = (tuple(size), tuple(color))
+        self.image = AbilityProjectile._images.get(key)
+        if self.image is None:
+            self.image = pygame.Surface(size)
+            self.image.fill(color)
+            AbilityProjectile._images[key] = self.image
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
         
@@ -63,7 +91,7 @@ class AbilityProjectile(pygame.sprite.Sprite):
         
         # Lifetime management
         self.lifetime = lifetime  # milliseconds, None for infinite
-        self.creation_time = pygame.time.get_ticks()
+        self.creation_time = sim_clock.now
         
         # Hit tracking for piercing and static projectiles
         self.hit_enemies = set() if piercing else None
@@ -77,13 +105,17 @@ class AbilityProjectile(pygame.sprite.Sprite):
             if closest_enemy:
                 self.update_homing_direction(closest_enemy)
         
+        # Stored projectiles are moved, expired and culled by ProjectileStore.step
+        if self.store is not None:
+            return
+        
         # Move projectile
         self.rect.x += self.dx
         self.rect.y += self.dy
         
         # Check lifetime
         if self.lifetime is not None:
-            current_time = pygame.time.get_ticks()
+            current_time = sim_clock.now
             if current_time - self.creation_time > self.lifetime:
                 self.kill()
                 return
@@ -93,24 +125,32 @@ class AbilityProjectile(pygame.sprite.Sprite):
             self.rect.bottom < -50 or self.rect.top > self.screen_height + 50):
             self.kill()
     
+    def attach_store(self, store, slot:int) -> None:
+        """Called by ProjectileStore.add once the state was copied into its arrays"""
+        self.store = store
+        self.store_slot = slot
+
+    def detach_store(self) -> None:
+        """Copy the velocity back from the store's arrays before leaving it"""
+        dx, dy = self.dx, self.dy
+        self.store = None
+        self.store_slot = -1
+        self.dx, self.dy = dx, dy
+
+    def kill(self) -> None:
+        """Leave the store (if any) and every group, then go back to the pool"""
+        if self.store is not None:
+            self.store.remove(self)
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+    
     def find_closest_enemy(self, enemies:list[BaseEnemy]) -> Optional[BaseEnemy]:
         """Find the closest enemy for homing behavior."""
         if not enemies:
             return None
         
-        closest_enemy = None
-        min_distance = float('inf')
-        
-        for enemy in enemies:
-            distance = math.hypot(
-                enemy.rect.centerx - self.rect.centerx,
-                enemy.rect.centery - self.rect.centery
-            )
-            if distance < min_distance:
-                min_distance = distance
-                closest_enemy = enemy
-        
-        return closest_enemy
+        return nearest_sprite(enemies, self.rect.center)
     
     def update_homing_direction(self, target:BaseEnemy) -> None:
         """Update direction to home in on target."""
@@ -157,7 +197,10 @@ class SpecialProjectile(AbilityProjectile):
     """
     Enhanced projectile for special abilities with visual effects.
     """
-    def __init__(self, 
+    # Drawn images shared by every projectile of the same type, size and color
+    _visuals: dict[tuple, pygame.Surface] = {}
+
+    def reset(self, 
         x: float, 
         y: float, 
         target_x: float, 
@@ -165,13 +208,18 @@ class SpecialProjectile(AbilityProjectile):
         projectile_type: Optional[str] = "magic_orb", 
         **kwargs
     ) -> None:
+        """(Re)initialize the projectile in place, so pooled instances can be reused"""
+        super().reset(x, y, target_x, target_y, **kwargs)
         self.projectile_type = projectile_type
-        super().__init__(x, y, target_x, target_y, **kwargs)
         self.setup_visual()
     
     def setup_visual(self) -> None:
         """Setup visual appearance based on projectile type."""
-        if self.projectile_type == "magic_orb":
+        key = (self.projectile_type, tuple(self.size), tuple(self.color))
+        image = SpecialProjectile._visuals.get(key)
+        if image is not None:
+            self.image = image
+        elif self.projectile_type == "magic_orb":
             # Create a glowing orb effect
             self.image = pygame.Surface(self.size, pygame.SRCALPHA)
             center = (self.size[0] // 2, self.size[1] // 2)
@@ -198,6 +246,7 @@ class SpecialProjectile(AbilityProjectile):
                     if dot_x < self.size[0] and dot_y < self.size[1]:
                         darker_color = tuple(max(0, c - 30) for c in self.color[:3])
                         pygame.draw.circle(self.image, darker_color, (dot_x, dot_y), 1)
+        SpecialProjectile._visuals[key] = self.image
         
         self.rect = self.image.get_rect()
         self.rect.center = (self.rect.centerx, self.rect.centery)  # Maintain position
@@ -2,8 +2,62 @@ import pygame
 import math
 from utils.settings import *
 from typing import Optional
+from utils.asset_cache import AssetCache
+from utils.transform_cache import transform_cache
+from utils.array_field import ArrayField
+from utils.sim_clock import sim_clock
+
+
+class ProjectileArchetype:
+    """
+    Visual data shared by every projectile fired with the same modifications.
+    Built once per distinct combination and reused for every later shot.
+    """
+    BASE_SPRITESHEET = 'assets/images/abilities/base/Base.png'
+    _archetypes: dict[tuple, "ProjectileArchetype"] = {}
+
+    def __init__(self, spritesheet: str, frame_delay: Optional[float], size: tuple, color: tuple) -> None:
+        try:
+            animation = AssetCache.get_animation(spritesheet)
+            self.run_frames = AssetCache.get_animation_frames(spritesheet)
+            # Passives may still override the sheet's own frame delay
+            self.frame_delay = frame_delay if frame_delay is not None else animation['frame_delay']
+            self.has_animation = True
+        except Exception as e:
+            print(f"Erro ao carregar spritesheet: {e}")
+            image = pygame.Surface(size)
+            image.fill(color)
+            self.run_frames = (image,)
+            self.frame_delay = frame_delay
+            self.has_animation = False
+
+    @classmethod
+    def get(cls, modifications: dict) -> "ProjectileArchetype":
+        """Return the archetype for the visual part of a modifications dict."""
+        spritesheet = modifications.get('spritesheet') or cls.BASE_SPRITESHEET
+        frame_delay = modifications.get('sprite_frame_delay')
+        size = tuple(modifications.get('size', (5, 5)))
+        color = tuple(modifications.get('color', BLUE))
+        key = (spritesheet, frame_delay, size, color)
+        archetype = cls._archetypes.get(key)
+        if archetype is None:
+            archetype = cls(spritesheet, frame_delay, size, color)
+            cls._archetypes[key] = archetype
+        return archetype
+
+
 class Projectile(pygame.sprite.Sprite):
-    def __init__(self, 
+    # Culled once the rect is fully this far outside the screen
+    cull_margin = 0
+
+    # Velocity, kept in the ProjectileStore's arrays while attached to one
+    dx = ArrayField('vel', column=0)
+    dy = ArrayField('vel', column=1)
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.reset(*args, **kwargs)
+
+    def reset(self, 
         x: float, 
         y: float, 
         target_x: float, 
@@ -16,60 +70,31 @@ class Projectile(pygame.sprite.Sprite):
         is_player_projectile: Optional[bool] = True, 
         angle: Optional[float] = None
     ) -> None:
-        super().__init__()
+        """(Re)initialize the projectile in place, so pooled instances can be reused"""
+        # Drop everything from a previous life (e.g. piercing state set by collisions)
+        self.__dict__.clear()
+        pygame.sprite.Sprite.__init__(self)
+        self.pool = None
+        
+        # Not part of a store until the ProjectileManager adds it to one
+        self.store = None
+        self.store_slot = -1
         
         # Store modifications and apply them
         self.modifications = modifications or {}
         self.is_player_projectile = is_player_projectile
-        # Apply modifications to get final properties
-        size = self.modifications.get('size', (5, 5))
-        color = self.modifications.get('color', BLUE)
         self.angle = angle
-        if 'spritesheet' in self.modifications:
-            spritesheet_path = self.modifications['spritesheet']
-            try:
-                sheet = pygame.image.load(spritesheet_path).convert_alpha()
-                frame_width = sheet.get_width() // 6
-                frame_height = sheet.get_height()
-                self.run_frames = [
-                    pygame.transform.scale(sheet.subsurface((i * frame_width, 0, frame_width, frame_height)), (40, 40))
-                    for i in range(6)
-                ]
-                self.current_frame = 0
-                self.frame_timer = 0
-                self.frame_delay = self.modifications.get('sprite_frame_delay')  # Default to 100ms
-                if self.angle is not None:
-                    self.image = pygame.transform.rotate(self.run_frames[0], self.angle)
-                else:
-                    self.image = self.run_frames[0]
-                self.has_animation = True
-            except Exception as e:
-                print(f"Erro ao carregar spritesheet: {e}")
-                self.image = pygame.Surface(size)
-                self.image.fill(color)
-                self.has_animation = False
+        # Frames are shared by every projectile with the same visual modifications
+        archetype = ProjectileArchetype.get(self.modifications)
+        self.run_frames = archetype.run_frames
+        self.has_animation = archetype.has_animation
+        self.frame_delay = archetype.frame_delay
+        self.current_frame = 0
+        self.frame_timer = 0
+        if self.has_animation and self.angle is not None:
+            self.image = transform_cache.get(self.run_frames[0], self.angle)
         else:
-            try:
-                sheet = pygame.image.load('assets/images/abilities/base/Base.png').convert_alpha()
-                frame_width = sheet.get_width() // 6
-                frame_height = sheet.get_height()
-                self.run_frames = [
-                    pygame.transform.scale(sheet.subsurface((i * frame_width, 0, frame_width, frame_height)), (20, 20))
-                    for i in range(6)
-                ]
-                self.current_frame = 0
-                self.frame_timer = 0
-                self.frame_delay = self.modifications.get('sprite_frame_delay')  # Default to 100ms
-                if self.angle is not None:
-                    self.image = pygame.transform.rotate(self.run_frames[0], self.angle)
-                else:
-                    self.image = self.run_frames[0]
-                self.has_animation = True
-            except Exception as e:
-                print(f"Erro ao carregar spritesheet: {e}")
-                self.image = pygame.Surface(size)
-                self.image.fill(color)
-                self.has_animation = False
+            self.image = self.run_frames[0]
 
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
@@ -91,13 +116,40 @@ class Projectile(pygame.sprite.Sprite):
         
         self.damage = damage
 
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        """Collision mask of the current image, only built when a collision check needs it"""
+        return AssetCache.get_mask(self.image)
+
+    def attach_store(self, store, slot:int) -> None:
+        """Called by ProjectileStore.add once the state was copied into its arrays"""
+        self.store = store
+        self.store_slot = slot
+
+    def detach_store(self) -> None:
+        """Copy the velocity back from the store's arrays before leaving it"""
+        dx, dy = self.dx, self.dy
+        self.store = None
+        self.store_slot = -1
+        self.dx, self.dy = dx, dy
+
+    def kill(self) -> None:
+        """Leave the store (if any) and every group, then go back to the pool"""
+        if self.store is not None:
+            self.store.remove(self)
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
     def update(self, *args, **kwargs) -> None:
         """Move projectile, now accepts any arguments"""
-        self.rect.x += self.dx
-        self.rect.y += self.dy
+        # Stored projectiles are moved and culled by ProjectileStore.step
+        if self.store is None:
+            self.rect.x += self.dx
+            self.rect.y += self.dy
 
         if hasattr(self, 'has_animation') and self.has_animation:
-            now = pygame.time.get_ticks()
+            now = sim_clock.now
             if self.frame_delay is not None and now - self.frame_timer >= self.frame_delay:
                 self.current_frame = (self.current_frame + 1) % len(self.run_frames)
                 self.frame_timer = now
@@ -105,11 +157,13 @@ class Projectile(pygame.sprite.Sprite):
                 current_frame = self.run_frames[self.current_frame]
                 if self.angle is not None:
                     center = self.rect.center
-                    self.image = pygame.transform.rotate(current_frame, self.angle)
+                    self.image = transform_cache.get(current_frame, self.angle)
                     self.rect = self.image.get_rect(center=center)
+                    if self.store is not None:
+                        self.store.sync_rect(self)
                 else:
                     self.image = current_frame
         # Remove if out of screen
-        if (self.rect.right < 0 or self.rect.left > self.screen_width or
-            self.rect.bottom < 0 or self.rect.top > self.screen_height):
+        if self.store is None and (self.rect.right < 0 or self.rect.left > self.screen_width or
+                                   self.rect.bottom < 0 or self.rect.top > self.screen_height):
             self.kill()
\ No newline at end of file
@@ -4,6 +4,8 @@ from utils.settings import *
 from entities.player.player import Player
 from ui.hud import HUD
 from ui.menu import MenuSystem
+from ui.dirty_renderer import DirtyRectRenderer
+from ui.perf_overlay import PerfOverlay
 from managers.ability_manager import AbilityManager
 from managers.enemy_spawner import EnemyManager
 from managers.projectile_manager import ProjectileManager
@@ -11,16 +13,28 @@ from managers.collision_manager import CollisionManager
 from managers.game_state_manager import GameStateManager
 from managers.experience_manager import ExperienceManager
 from utils.database import DatabaseManager
+from utils.asset_cache import AssetCache
+from utils.fixed_timestep import FixedTimestep, RenderInterpolator
+from utils.sim_clock import sim_clock
+from utils.frame_timer import FrameTimer
 
 class GameController:
     """
     Primary game management class responsible for coordinating game systems.
     """
-    def __init__(self) -> None:
-        """Initialize the game with all necessary components."""
+    # Timing spans of a frame, in the order they run (columns of the frame stats CSV)
+    TIMING_PHASES = (
+        'player', 'abilities', 'spawning', 'enemies', 'experience', 'shooting', 'projectiles',
+        'collide_projectile_enemy', 'collide_projectile_player', 'collide_enemy_player', 'collide_experience',
+        'render',
+    )
+    COUNT_COLUMNS = ('n_enemies', 'n_projectiles', 'n_orbs', 'n_effects')
+    
+    def __init__(self, db_path:str = "game_data.db") -> None:
+        """Initialize the game with all necessary components (rankings are kept in db_path)."""
         pygame.init()
         pygame.display.set_caption(GAME_TITLE)
-        self.database = DatabaseManager("game_data.db")
+        self.database = DatabaseManager(db_path)
         self.current_name = ""
         
         # Screen and timing setup
@@ -31,9 +45,21 @@ class GameController:
             self.width, self.height = SCREEN_WIDTH, SCREEN_HEIGHT
             self.screen = pygame.display.set_mode((self.width, self.height))
         
+        # Load the packed sprite atlas once (falls back to individual PNGs if not built)
+        AssetCache.load_atlas()
+
         # Initialize clock for timing and frame rate control
         self.clock = pygame.time.Clock()
         self.elapsed_time = 0
+        # Fixed-rate simulation, decoupled from the render frame rate
+        self.timestep = FixedTimestep()
+        self.interpolator = RenderInterpolator() if RENDER_INTERPOLATION else None
+        # Wall time per update phase, for profiling
+        self.frame_timer = FrameTimer()
+        if FRAME_STATS_CSV:
+            self.frame_timer.open_csv(FRAME_STATS_CSV, self.TIMING_PHASES, self.COUNT_COLUMNS)
+        # Where keys come from each tick (the keyboard unless e.g. a bot is plugged in)
+        self.input_source = None
                 
         # UI Systems
         self.menu_system = MenuSystem(self.screen, self.database)
@@ -44,18 +70,28 @@ class GameController:
         self.background = pygame.image.load("assets/images/ui/background/Background.png").convert()
         self.background = pygame.transform.scale(self.background, (self.width, self.height))
         
+        # Timing overlay, toggled with PERF_OVERLAY_KEY
+        self.perf_overlay = PerfOverlay(self.screen, self.frame_timer)
+        
+        # Optional renderer that only repaints changed areas while playing
+        self.dirty_renderer = DirtyRectRenderer(self.screen, self.background) if DIRTY_RECT_RENDERING else None
+        
         # Initialize game state
         self.reset_game_state()
     
     def reset_game_state(self) -> None:
         """Reset all game variables to their initial state."""
-        # All sprites group for rendering
-        self.all_sprites = pygame.sprite.Group()
+        # Each run starts from a fresh game clock
+        sim_clock.reset()
+        
+        # Render registry shared by all managers: sprites join it when they
+        # spawn and leave it when killed, drawn layer by layer
+        self.all_sprites = pygame.sprite.LayeredUpdates()
         
         # Create player at screen center
         self.player = Player(self.width // 2, self.height // 2, 
                            screen_width=self.width, screen_height=self.height)
-        self.all_sprites.add(self.player)
+        self.all_sprites.add(self.player, layer=LAYER_PLAYER)
         
         # Create HUD for the player
         self.hud = HUD(self.player, self.screen)
@@ -64,8 +100,8 @@ class GameController:
         self.ability_manager = AbilityManager(self.player)
         
         # Create game managers
-        self.enemy_manager:EnemyManager = EnemyManager(self.player, self.width, self.height)
-        self.projectile_manager = ProjectileManager(self.player, self.width, self.height)
+        self.enemy_manager:EnemyManager = EnemyManager(self.player, self.width, self.height, self.all_sprites)
+        self.projectile_manager = ProjectileManager(self.player, self.width, self.height, self.all_sprites)
         self.collision_manager = CollisionManager(self.player)
         self.experience_manager = ExperienceManager(self.player)
         
@@ -207,7 +243,7 @@ class GameController:
                 else:
                     print(f"❌ Falha ao ativar '{ability.name}'")
             else:
-                remaining = (ability.last_activation + ability.cooldown - pygame.time.get_ticks()) / 1000
+                remaining = (ability.last_activation + ability.cooldown - sim_clock.now) / 1000
                 print(f"⏳ Cooldown: {remaining:.1f}s restantes")
         else:
             print(f"❌ Habilidade '{test_key}' não encontrada!")
@@ -272,31 +308,35 @@ class GameController:
                     if name_confirmed and len(self.current_name) > 0:
                         # Save name to database
                         self.database.adicionar(self.current_name, int(self.elapsed_time))
+                        self.menu_system.invalidate_cache('game_over')  # Rankings changed
                         self.current_name = ""
                         self.state_manager.change_state(self.state_manager.GAME_OVER)
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:  # ESC para sair
+                        self.frame_timer.close_csv()
                         pygame.quit()
                         sys.exit()
+                    elif event.key == PERF_OVERLAY_KEY:
+                        self.perf_overlay.toggle()
                   
             # Handle test mode input
             self.handle_test_mode_input(events)
             
             # Update game state if playing
             if self.state_manager.is_state(self.state_manager.PLAYING):
-                self.update_game_state()
-                self.elapsed_time += self.clock.get_time() / 1000  # Update elapsed time
-                
-                # Check if game time limit is reached
-                if self.elapsed_time >= GAME_TIME_LIMIT:
-                    self.trigger_game_won()
+                self.simulate(self.timestep.advance(sim_clock.frame_time(self.clock.get_time())))
+            else:
+                # Time spent in menus doesn't need catching up
+                self.timestep.reset()
                           
             # Render appropriate screen
             self.render_screen()
+            self.frame_timer.end_frame(**self.entity_counts())
         
             # Control game frame rate
             self.clock.tick(FPS)
             
+        self.frame_timer.close_csv()
         pygame.quit()
         sys.exit()
     
@@ -324,60 +364,127 @@ class GameController:
             # Still need to tick the clock here to maintain frame rate
             self.clock.tick(FPS)
     
+    def simulate(self, steps:int) -> None:
+        """Run fixed simulation steps until caught up or the game leaves PLAYING."""
+        for step in range(steps):
+            if self.interpolator and step == steps - 1:
+                # Rendering interpolates from where the last step starts
+                self.interpolator.snapshot(self.all_sprites)
+            self.update_game_state()
+            self.elapsed_time += self.timestep.step_ms / 1000  # Update elapsed time
+            
+            # Check if game time limit is reached
+            if self.elapsed_time >= GAME_TIME_LIMIT:
+                self.trigger_game_won()
+            if not self.state_manager.is_state(self.state_manager.PLAYING):
+                # Paused (level up, game over...), drop the remaining steps
+                self.timestep.reset()
+                if self.interpolator:
+                    self.interpolator.clear()
+                break
+    
     def update_game_state(self) -> None:
         """Update all game logic."""
+        # Every timer reads this tick's time from the shared clock
+        sim_clock.tick()
+        timer = self.frame_timer
+        timer.begin()
+        
         # Get current keyboard state
-        keys = pygame.key.get_pressed()
+        keys = self.input_source(self) if self.input_source else pygame.key.get_pressed()
         
         # Update player
         self.player.update(keys)
+        timer.lap('player')
         
         # Update ability system
-        dt = self.clock.get_time()
+        dt = self.timestep.step_ms
         self.ability_manager.update(dt, keys)
+        timer.lap('abilities')
         
         # Spawn enemies periodically
         self.enemy_manager.spawn_enemy(self.elapsed_time)
         self.enemy_manager.spawn_boss(self.elapsed_time)
+        timer.lap('spawning')
         # Update enemies
         self.enemy_manager.update(keys)
+        timer.lap('enemies')
+        # Fuse experience orbs piling up on the ground
+        self.experience_manager.update()
+        timer.lap('experience')
         
         # Handle player shooting
         self.projectile_manager.handle_auto_shooting(self.enemy_manager.enemies)
         self.projectile_manager.handle_enemy_auto_shooting(self.enemy_manager.enemies)
+        timer.lap('shooting')
         
         # Update projectiles (pass enemies for homing projectiles)
         self.projectile_manager.update(self.enemy_manager.enemies)
+        timer.lap('projectiles')
         
-        # Check for collisions
+        # Check for collisions (timed per check)
         self.check_collisions()
-        
-        # Update all sprite groups
-        self.all_sprites = pygame.sprite.Group()
-        self.all_sprites.add(self.experience_manager.all_sprites)
-        self.all_sprites.add(self.player)
-        self.all_sprites.add(self.enemy_manager.enemies)
-        self.all_sprites.add(self.projectile_manager.projectiles)
     
     def check_collisions(self) -> None:
         """Handle all collision detection and resolution."""
+        timer = self.frame_timer
         # Projectile-Enemy Collisions
         killed_enemies = self.collision_manager.check_projectile_enemy_collisions(
             self.projectile_manager.player_projectiles, self.enemy_manager.enemies)
+        timer.lap('collide_projectile_enemy')
         
         collided_projectiles, is_player_dead = self.collision_manager.check_projectile_player_collisions(
             self.projectile_manager.enemy_projectiles)
+        timer.lap('collide_projectile_player')
         # Enemy-Player Collisions
         collided_enemies, is_player_dead = self.collision_manager.check_enemy_player_collisions(
             self.enemy_manager.enemies)
+        timer.lap('collide_enemy_player')
         
         collided_experience = self.collision_manager.check_player_experience_collisions()
+        timer.lap('collide_experience')
         
         if is_player_dead:
             self.trigger_input_name()
     
     def render_screen(self) -> None:
         """Render appropriate screen based on game state."""
+        playing = self.state_manager.is_state(self.state_manager.PLAYING)
+        self.frame_timer.start()
+        if self.interpolator and playing:
+            # Draw sprites between their last two simulated positions
+            self.interpolator.begin(self.timestep.alpha)
+            self.draw_state()
+            self.interpolator.end()
+        else:
+            self.draw_state()
+        if playing:
+            self.frame_timer.lap('render')
+    
+    def entity_counts(self) -> dict[str, int]:
+        """How many of each kind of entity are alive, as the COUNT_COLUMNS of the frame stats"""
+        return {
+            'n_enemies': len(self.enemy_manager.enemies),
+            'n_projectiles': len(self.projectile_manager.projectiles),
+            'n_orbs': len(self.experience_manager),
+            'n_effects': len(self.enemy_manager.status_effects),
+        }
+    
+    def draw_state(self) -> None:
+        """Draw the screen for the current game state and present it."""
+        if self.dirty_renderer:
+            if self.state_manager.is_state(self.state_manager.PLAYING):
+                self.dirty_renderer.render([
+                    self.experience_manager.draw,
+                    lambda screen: self.enemy_manager.draw_boss(screen, self.hud),
+                    DirtyRectRenderer.draw_sprites(self.all_sprites),
+                    lambda screen: self.hud.draw(int(self.elapsed_time), self.ability_manager),
+                    lambda screen: self.perf_overlay.draw(self.entity_counts()),
+                ])
+                return
+            # Menus and overlays repaint the whole screen, so start clean when play resumes
+            self.dirty_renderer.invalidate()
+
         if self.state_manager.is_state(self.state_manager.MAIN_MENU):
             # Menu screen
             self.menu_system.draw_start_menu()
@@ -394,6 +501,7 @@ class GameController:
             # Base game still visible under level up menu
             # Draw game first
             self.screen.blit(self.background, (0, 0))
+            self.experience_manager.draw(self.screen)
             self.all_sprites.draw(self.screen)
             self.hud.draw(int(self.elapsed_time), self.ability_manager)
         
@@ -404,9 +512,11 @@ class GameController:
         else:
             # Normal game rendering
             self.screen.blit(self.background, (0, 0))
+            self.experience_manager.draw(self.screen)
             self.enemy_manager.draw_boss(self.screen, self.hud)
             self.all_sprites.draw(self.screen)
             self.hud.draw(int(self.elapsed_time), self.ability_manager)
+            self.perf_overlay.draw(self.entity_counts())
         
         # Update display
         pygame.display.flip()
@@ -54,41 +54,13 @@ class AbilityManager:
         # Update all player abilities
         for ability in self.player_abilities.values():
             ability.update(dt, self.player, enemies, 
-                         projectile_manager=self.projectile_manager)
+                         projectile_manager=self.projectile_manager,
+                         status_effects=self.enemy_manager.status_effects)
         
         # Handle auto-triggered abilities
         for ability_name, ability in self.player_abilities.items():
             if hasattr(ability, 'should_auto_trigger') and ability.should_auto_trigger(self.player, enemies):
                 self.activate_ability(ability_name, keys=keys)
-        
-        # Update enemy status effects
-        self.update_enemy_effects(enemies)
-    
-    def update_enemy_effects(self, enemies:list[BaseEnemy]) -> None:
-        """Update status effects on enemies."""
-        current_time = pygame.time.get_ticks()
-        
-        for enemy in enemies:
-            # Handle freeze
-            if hasattr(enemy, 'frozen') and enemy.frozen:
-                if current_time >= enemy.freeze_end_time:
-                    enemy.frozen = False
-                    enemy.speed = getattr(enemy, 'original_speed', ENEMY_SPEED)
-            
-            # Handle burning
-            if hasattr(enemy, 'burning') and enemy.burning:
-                if current_time >= enemy.burn_end_time:
-                    enemy.burning = False
-                    enemy.speed = getattr(enemy, 'original_speed', ENEMY_SPEED)  # Restore speed when burn ends
-                else:
-                    # Apply burn damage periodically
-                    if not hasattr(enemy, 'last_burn_tick'):
-                        enemy.last_burn_tick = current_time
-                    elif current_time - enemy.last_burn_tick >= 500:  # Every 500ms (0.5 seconds)
-                        if enemy.take_damage(enemy.burn_damage):
-                            self.player.gain_exp(5)  # Give exp when enemy dies from burn
-                            enemy.kill()
-                        enemy.last_burn_tick = current_time
     
     def activate_ability(self, ability_name:str, **kwargs) -> bool:
         """Activate a specific ability."""
@@ -99,6 +71,7 @@ class AbilityManager:
                 self.player, 
                 enemies=enemies,
                 projectile_manager=self.projectile_manager,
+                status_effects=self.enemy_manager.status_effects if self.enemy_manager else None,
                 **kwargs
             )
         return False
@@ -6,15 +6,20 @@ from entities.projectiles.ability_projectile import AbilityProjectile
 from utils.settings import *
 from entities.player.player import Player
 from managers.experience_manager import ExperienceManager
+from entities.experience.experience import Experience
 from managers.enemy_spawner import EnemyManager
 from entities.projectiles.projectile import Projectile
 from entities.enemys.base_enemy import BaseEnemy
+from utils.spatial_hash import SpatialHash, IndexedGroup
+from utils.sim_clock import sim_clock
 class CollisionManager:
     """
     Handles all collision detection and resolution in the game.
     """
     def __init__(self, player:Player) -> None:
         self.player = player
+        # Broadphase grid over enemy rects, for enemy groups without their own index
+        self.enemy_grid = SpatialHash()
 
     def set_manager(self, experience_manager:ExperienceManager, enemy_manager:EnemyManager)-> None:
         """Set the experience manager for handling enemy kills"""
@@ -24,13 +29,23 @@ class CollisionManager:
     def check_projectile_enemy_collisions(self, projectiles:list[Projectile], enemies:list[BaseEnemy])-> list[BaseEnemy]:
         """Check for collisions between projectiles and enemies"""
         killed_enemies = []
+        if not projectiles:
+            return killed_enemies
+        
+        # Rects don't move during the check, so one grid serves every projectile;
+        # enemies killed along the way are filtered by group membership
+        if isinstance(enemies, IndexedGroup):
+            enemy_grid = enemies.index
+        else:
+            enemy_grid = self.enemy_grid
+            enemy_grid.rebuild(enemies)
         
         for projectile in projectiles:
             # Initialize piercing hit tracking
             if getattr(projectile, 'piercing', False) and not hasattr(projectile, 'hit_enemies'):
                 projectile.hit_enemies = set()
             
-            hit_enemies = pygame.sprite.spritecollide(projectile, enemies, False)
+            hit_enemies = [e for e in enemy_grid.query_rect(projectile.rect) if e in enemies]
             
             for enemy in hit_enemies:
                 # Skip if already hit by piercing projectile
@@ -38,7 +53,7 @@ class CollisionManager:
                     continue
 
 
-                if getattr(projectile, 'static', False) and enemy in projectile.jump_enemies:
+                if getattr(projectile, 'static', False) and enemy in getattr(projectile, 'jump_enemies', ()):
                     continue
 
                 # Apply damage once per enemy
@@ -87,9 +102,8 @@ class CollisionManager:
 
                     # Find the closest enemy not already jumped to and within the radius
                     available_enemies = [
-                        e for e in enemies
-                        if e not in projectile.jump_enemies and e != enemy and
-                        pygame.math.Vector2(e.rect.center).distance_to(projectile.first_contact_pos) <= chase_radius
+                        e for e in enemy_grid.query_radius(projectile.first_contact_pos, chase_radius)
+                        if e in enemies and e not in projectile.jump_enemies and e != enemy
                     ]
                     if available_enemies:
                         closest_enemy = min(
@@ -112,6 +126,8 @@ class CollisionManager:
                                     angle = math.degrees(math.atan2(-projectile.dy, projectile.dx))
                                     projectile.angle = angle
                                     projectile.rect = projectile.image.get_rect(center=center)
+                                    if getattr(projectile, 'store', None) is not None:
+                                        projectile.store.sync_rect(projectile)
                                     
                     else:
                         projectile.kill()
@@ -126,8 +142,10 @@ class CollisionManager:
     def check_projectile_player_collisions(self, projectiles: list[Projectile]) -> tuple[list[Projectile], bool]:
         """Check for collisions between projectiles and player"""
         collided_projectiles = []
+        player_rect = self.player.rect
         for projectile in projectiles:
-            if pygame.sprite.collide_mask(projectile, self.player):
+            # Cheap rect test first, masks are only built for overlapping sprites
+            if projectile.rect.colliderect(player_rect) and pygame.sprite.collide_mask(projectile, self.player):
                 # Handle player hit by projectile
                 self.player.hp -= projectile.damage
                 projectile.kill()
@@ -139,48 +157,36 @@ class CollisionManager:
         """Check for collisions between enemies and player"""
         collided_enemies = []
         
+        player_rect = self.player.rect
         for enemy in enemies:
-            if pygame.sprite.collide_mask(enemy, self.player) and self.player.last_hit_time + PLAYER_INVICIBILITY_TIME < pygame.time.get_ticks():
+            if not enemy.rect.colliderect(player_rect):
+                continue
+            if pygame.sprite.collide_mask(enemy, self.player) and self.player.last_hit_time + PLAYER_INVICIBILITY_TIME < sim_clock.now:
               # Normal collision damage
                 damage = enemy.damage if hasattr(enemy, 'damage') else 10
                 self.player.hp -= damage
-                self.player.last_hit_time = pygame.time.get_ticks()
+                self.player.last_hit_time = sim_clock.now
                 collided_enemies.append(enemy)
                 
         return collided_enemies, self.player.hp <= 0
     
-    def check_player_experience_collisions(self) -> list[pygame.sprite.Sprite]:
+    def check_player_experience_collisions(self) -> list[Experience]:
         """Check for collisions between player and experience orbs"""
-        collided_experience = []
-        
-        for xp in self.experience_manager.experience_group:
-            if pygame.sprite.collide_mask(xp, self.player):
-                # Player collects experience orb
-                xp.kill()
-                collided_experience.append(xp)
-        
-        return collided_experience
+        # Distance check against the orbs in the grid cells around the player
+        return self.experience_manager.collect_nearby(self.player.rect.center)
     
     def apply_projectile_effects(self, projectile: Projectile, enemy:BaseEnemy) -> None:
         """Apply special effects from projectiles to enemies"""
         # Apply frozen claw effect
+        status_effects = self.enemy_manager.status_effects
         if (hasattr(self.player, 'has_frozen_claw') and self.player.has_frozen_claw and 
             random.random() < self.player.freeze_chance):
-            enemy.frozen = True
-            enemy.freeze_end_time = pygame.time.get_ticks() + self.player.freeze_duration
-            enemy.original_speed = getattr(enemy, 'original_speed', enemy.speed)
-            enemy.speed = 0
+            status_effects.freeze(enemy, self.player.freeze_duration)
         
         # Apply flaming paws effect
         if (hasattr(self.player, 'has_flaming_paws') and self.player.has_flaming_paws):
-            enemy.burning = True
-            enemy.burn_end_time = pygame.time.get_ticks() + self.player.burn_duration
-            enemy.burn_damage = self.player.burn_damage
             # Don't change speed for burning enemies - they can still move while burning
-                
-            # Start burn damage timer
-            if not hasattr(enemy, 'last_burn_tick'):
-                enemy.last_burn_tick = pygame.time.get_ticks()
+            status_effects.burn(enemy, self.player.burn_duration, self.player.burn_damage)
                 
         # Apply cleaning tongue effect
         if (hasattr(self.player, 'has_cleaning_tongue') and self.player.has_cleaning_tongue and 
@@ -11,26 +11,36 @@ from entities.player.player import Player
 from entities.enemys.base_enemy import BaseEnemy
 from entities.enemys.base_boss import BaseBoss
 from typing import Optional
+from utils.enemy_snapshot import EnemyGroup
+from managers.enemy_swarm import EnemySwarm
+from managers.status_effects import StatusEffectScheduler
+from utils.sim_clock import sim_clock
 class EnemyManager:
     """
     Handles enemy spawning and management.
     """
-    def __init__(self, player:Player, screen_width:float, screen_height:float):
+    def __init__(self, player:Player, screen_width:float, screen_height:float, render_group:Optional[pygame.sprite.LayeredUpdates] = None):
         self.player = player
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.last_enemy_spawn = pygame.time.get_ticks()
-        self.last_boss_spawn = pygame.time.get_ticks()
+        self.last_enemy_spawn = sim_clock.now
+        self.last_boss_spawn = sim_clock.now
         self.is_boss_alive = False  # Track if a boss is currently alive
-        self.enemies = pygame.sprite.Group()
+        # Indexed so nearest and area queries don't scan every enemy
+        self.enemies = EnemyGroup()
+        # Array-backed state of the chase enemies, moved in one vectorized step
+        self.swarm = EnemySwarm()
+        # Freeze, burn, stun, charm and shock timers, run as they come due
+        self.status_effects = StatusEffectScheduler(on_burn_kill=self.on_burn_kill)
         self.boss = pygame.sprite.Group()
-        self.all_sprites = pygame.sprite.Group()
+        # Long-lived render registry; enemies leave it when killed
+        self.all_sprites = render_group if render_group is not None else pygame.sprite.LayeredUpdates()
     
     def spawn_enemy(self, elapsed_time:int)-> BaseEnemy:
         """
         Spawn enemies based on game time and difficulty progression.
         """
-        current_time = pygame.time.get_ticks()
+        current_time = sim_clock.now
         if current_time - self.last_enemy_spawn > SPAWN_INTERVAL:
             # Choose a random enemy type based on current difficulty
             enemy_types = [
@@ -59,8 +69,7 @@ class EnemyManager:
             enemy_class = random.choices(enemy_types, weights=weights)[0]
             # Create the selected enemy type
             enemy = enemy_class(self.player, screen_width=self.screen_width, screen_height=self.screen_height)
-            self.enemies.add(enemy)
-            self.all_sprites.add(enemy)
+            self.add_enemy(enemy)
             self.last_enemy_spawn = current_time
             return enemy
         return None
@@ -69,43 +78,69 @@ class EnemyManager:
         """
             Spawn a boss if one is not alive, 5 minutes cooldown
         """
-        current_time = pygame.time.get_ticks()
+        current_time = sim_clock.now
         if current_time - self.last_boss_spawn > BOSS_SPAWN_INTERVAL and self.is_boss_alive == False:
             # Create a boss enemy
             boss = BigSquare(self.player, screen_width=self.screen_width, screen_height=self.screen_height)
             self.boss.add(boss)
-            self.enemies.add(boss)
-            self.all_sprites.add(boss)
+            self.add_enemy(boss)
             self.is_boss_alive = True
             return boss
         return None
     
+    def add_enemy(self, enemy:BaseEnemy) -> None:
+        """Track an enemy, register it for rendering and hand chase enemies to the swarm"""
+        self.enemies.add(enemy)
+        self.all_sprites.add(enemy, layer=LAYER_ENEMIES)
+        if enemy.swarm_movement:
+            self.swarm.add(enemy)
+    
     def kill_boss(self) -> None:
         """Reset boss spawn state"""
-        self.last_boss_spawn = pygame.time.get_ticks()
+        self.last_boss_spawn = sim_clock.now
         self.is_boss_alive = False
     
+    def on_burn_kill(self, enemy:BaseEnemy) -> None:
+        """Handle an enemy killed by burn damage"""
+        self.player.gain_exp(5)  # Give exp when enemy dies from burn
+        if enemy.is_boss:
+            self.kill_boss()
+        enemy.kill()
+    
     def update(self, *args, **kwargs) -> None:
         """Update all enemies"""
+        # Expire status effects and apply burn ticks before anything moves
+        self.status_effects.update()
+        # Chase enemies all move at once; the per-sprite update then only animates them
+        self.swarm.step(self.player.rect.center)
         self.enemies.update(*args, **kwargs)
+        # Enemies moved, queries this tick rebuild the index once
+        self.enemies.invalidate_index()
         
     def draw(self, screen:pygame.Surface) -> None:
         """Draw all enemies"""
         self.enemies.draw(screen)
 
-    def draw_boss(self, screen:pygame.Surface, hud:"HUD"=None) -> None:
-        """Draw the boss if it exists and its health bar"""
+    def draw_boss(self, screen:pygame.Surface, hud:"HUD"=None) -> list[pygame.Rect]:
+        """Draw the boss if it exists and its health bar, returning the areas drawn"""
+        rects = []
         if self.boss:
-            self.boss.draw(screen)
+            rects = screen.blits([(boss.image, boss.rect) for boss in self.boss])
             
             # Desenhe a barra de vida para cada boss
             if hud:
                 for boss in self.boss:
-                    hud.draw_boss_health_bar(boss)
+                    bar_rect = hud.draw_boss_health_bar(boss)
+                    if bar_rect:
+                        rects.append(bar_rect)
+        return rects
     
     def reset(self) -> None:
         """Clear all enemies"""
+        self.all_sprites.remove(self.enemies)
+        self.swarm.clear()
+        self.status_effects.clear()
         self.enemies.empty()
-        self.all_sprites.empty()
+        self.boss.empty()
         self.isBossAlive = False
         self.last_boss_spawn = 0
\ No newline at end of file
@@ -0,0 +1,109 @@
+import numpy as np
+import pygame
+from typing import Tuple
+from utils.settings import ENEMY_SWARM_CAPACITY
+
+
+class EnemySwarm:
+    """
+    Struct-of-arrays store for the enemies that simply chase the player.
+    Positions, speeds, HP and status flags live in NumPy arrays and the whole
+    swarm is moved by one vectorized step per tick; attached sprites read and
+    write their state through ArrayFields and only keep what rendering needs.
+    Slots are kept dense: removing an enemy moves the last one into its slot.
+    """
+    def __init__(self, capacity: int = ENEMY_SWARM_CAPACITY) -> None:
+        self.count = 0
+        self.sprites: list[pygame.sprite.Sprite] = []
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        # Integer rect centers, as pygame rounds them from pos
+        self.center = np.zeros((capacity, 2), dtype=np.int64)
+        self.angle = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.hp = np.zeros(capacity, dtype=np.float64)
+        self.frozen = np.zeros(capacity, dtype=bool)
+        self.charmed = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self) -> None:
+        capacity = len(self.pos) * 2
+        for name in ('pos', 'center', 'angle', 'speed', 'hp', 'frozen', 'charmed'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, enemy: pygame.sprite.Sprite) -> None:
+        """Move an enemy's simulation state into the swarm."""
+        if enemy.swarm is not None:
+            return
+        if self.count == len(self.pos):
+            self._grow()
+        slot = self.count
+        self.pos[slot] = (enemy.pos_x, enemy.pos_y)
+        self.center[slot] = enemy.rect.center
+        self.angle[slot] = getattr(enemy, 'angle', None) or 0.0
+        self.speed[slot] = enemy.speed
+        self.hp[slot] = enemy.hp
+        self.frozen[slot] = enemy.frozen
+        self.charmed[slot] = enemy.charmed
+        self.sprites.append(enemy)
+        self.count += 1
+        enemy.attach_swarm(self, slot)
+
+    def remove(self, enemy: pygame.sprite.Sprite) -> None:
+        """Hand an enemy's state back to the sprite and free its slot."""
+        if enemy.swarm is not self:
+            return
+        slot = enemy.swarm_slot
+        enemy.detach_swarm()
+        last = self.count - 1
+        if slot != last:
+            moved = self.sprites[last]
+            self.sprites[slot] = moved
+            for array in (self.pos, self.center, self.angle, self.speed, self.hp, self.frozen, self.charmed):
+                array[slot] = array[last]
+            moved.swarm_slot = slot
+        self.sprites.pop()
+        self.count -= 1
+
+    def clear(self) -> None:
+        """Detach every enemy."""
+        while self.count:
+            self.remove(self.sprites[-1])
+
+    def step(self, target: Tuple[int, int]) -> None:
+        """
+        Move every enemy that isn't frozen or charmed one step towards target,
+        the same chase BaseEnemy.update does for a single enemy.
+        """
+        n = self.count
+        if n == 0:
+            return
+        active = ~(self.frozen[:n] | self.charmed[:n])
+        offsets = np.asarray(target, dtype=np.float64) - self.center[:n]
+        dx, dy = offsets[:, 0], offsets[:, 1]
+        distance = np.hypot(dx, dy)
+        # Zero distance leaves the direction as is (and the enemy in place)
+        safe_distance = np.where(distance != 0, distance, 1.0)
+        step = offsets / safe_distance[:, None] * self.speed[:n, None]
+
+        pos = self.pos[:n]
+        pos[active] += step[active]
+        # 0.0 - dy rather than -dy: a -0.0 would turn 180 degrees into -180
+        self.angle[:n][active] = np.degrees(np.arctan2(0.0 - dy, dx))[active]
+        # pygame rounds float centers half away from zero
+        moved = pos[active]
+        self.center[:n][active] = np.copysign(np.floor(np.abs(moved) + 0.5), moved)
+
+        # Sprites only get what rendering needs
+        centers = self.center[:n].tolist()
+        angles = self.angle[:n].tolist()
+        for sprite, is_active, center, angle in zip(self.sprites, active.tolist(), centers, angles):
+            sprite.angle = angle
+            sprite.swarm_moved = is_active
+            if is_active:
+                sprite.rect.center = center
+
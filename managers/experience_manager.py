@@ -1,24 +1,153 @@
+import math
+import numpy as np
 import pygame
 from entities.enemys.base_enemy import BaseEnemy
+from entities.experience.experience import Experience
 from entities.player.player import Player
+from typing import Iterable, Optional, Tuple
+from utils.settings import (ORB_MERGE_INTERVAL, ORB_MERGE_RADIUS, ORB_CAP, ORB_GRID_CELL_SIZE,
+                            ORB_PICKUP_RADIUS, ORB_MAGNET, ORB_MAGNET_RADIUS, ORB_MAGNET_SPEED)
+from utils.spatial_hash import SpatialHash
+from utils.sim_clock import sim_clock
 class ExperienceManager:
-    def __init__(self, player:Player) -> None:
+    def __init__(self, player:Player, cap:int = ORB_CAP) -> None:
         self.player = player
-        self.experience_group = pygame.sprite.Group()
-        self.all_sprites = pygame.sprite.Group()
+        # Orbs on the ground, oldest first, drawn below every sprite with one blits call
+        self.orbs: list[Experience] = []
+        self.cap = cap
+        # Grid over the orbs so pickup and magnet only look near the player;
+        # kept in step with the list, rebuilt after merges
+        self.grid = SpatialHash(ORB_GRID_CELL_SIZE)
+        self._grid_valid = True
+        self.magnet = ORB_MAGNET
+        self.last_merge = sim_clock.now
+        # Metrics
+        self.merged = 0      # orbs fused into a neighbour by merge passes
+        self.cap_merged = 0  # orbs fused away to stay under the cap
+
+    def __len__(self) -> int:
+        return len(self.orbs)
 
     def kill_enemy(self, enemy:BaseEnemy) -> None:
         """Handle enemy death, drop experience, and remove from groups"""
         xp = enemy.kill()
-        self.experience_group.add(xp)
-        self.all_sprites.add(xp)
+        self.orbs.append(xp)
+        if self._grid_valid:
+            self.grid.insert(xp)
         return None
-    
-    def draw(self, screen:pygame.Surface) -> None:
-        """Draw all experience sprites on the screen"""
-        self.experience_group.draw(screen)
+
+    def index(self) -> SpatialHash:
+        """The orb grid, rebuilt first if merging replaced the orbs"""
+        if not self._grid_valid:
+            self.grid.rebuild(self.orbs)
+            self._grid_valid = True
+        return self.grid
+
+    def remove(self, orbs:Iterable[Experience]) -> None:
+        """Take collected orbs off the ground"""
+        gone = set(orbs)
+        if gone:
+            self.orbs = [orb for orb in self.orbs if orb not in gone]
+            if self._grid_valid:
+                for orb in gone:
+                    self.grid.remove(orb)
+
+    def collect_nearby(self, center:Tuple[int, int], radius:float = ORB_PICKUP_RADIUS) -> list[Experience]:
+        """Give the player every orb whose center is within radius of center"""
+        collected = self.index().query_radius(center, radius)
+        for orb in collected:
+            orb.collect()
+        self.remove(collected)
+        return collected
+
+    def pull_towards(self, center:Tuple[int, int], radius:float = ORB_MAGNET_RADIUS,
+                     speed:float = ORB_MAGNET_SPEED) -> None:
+        """Move the orbs within radius of center up to speed pixels towards it"""
+        grid = self.index()
+        x, y = center
+        for orb in grid.query_radius(center, radius):
+            ox, oy = orb.rect.center
+            distance = math.hypot(x - ox, y - oy)
+            grid.remove(orb)
+            if distance <= speed:
+                orb.rect.center = center
+            else:
+                orb.rect.center = (ox + (x - ox) / distance * speed, oy + (y - oy) / distance * speed)
+            grid.insert(orb)
+
+    def update(self, now:Optional[int] = None) -> None:
+        """Periodically fuse nearby orbs, keep their number under the cap and run the magnet"""
+        now = sim_clock.now if now is None else now
+        if now - self.last_merge >= ORB_MERGE_INTERVAL:
+            self.last_merge = now
+            self.merge_nearby()
+        self.enforce_cap()
+        if self.magnet:
+            self.pull_towards(self.player.rect.center)
+
+    def merge_nearby(self, radius:int = ORB_MERGE_RADIUS) -> int:
+        """
+        Fuse orbs that share a grid cell of the given size into the oldest of
+        them, which keeps its position and carries the summed value.
+        Returns how many orbs were merged away.
+        """
+        cells: dict[tuple[int, int], Experience] = {}
+        kept = []
+        for orb in self.orbs:
+            x, y = orb.rect.center
+            key = (x // radius, y // radius)
+            survivor = cells.get(key)
+            if survivor is None:
+                cells[key] = orb
+                kept.append(orb)
+            else:
+                survivor.value += orb.value
+        merged = len(self.orbs) - len(kept)
+        if merged:
+            self.orbs = kept
+            self._grid_valid = False
+        self.merged += merged
+        return merged
+
+    def enforce_cap(self) -> int:
+        """
+        Fold the oldest orbs over the cap into their nearest remaining orb.
+        Returns how many orbs were merged away.
+        """
+        excess = len(self.orbs) - self.cap
+        if excess <= 0:
+            return 0
+        doomed, kept = self.orbs[:excess], self.orbs[excess:]
+        if not kept:
+            # Zero cap: everything fuses into the newest orb
+            doomed, kept = doomed[:-1], doomed[-1:]
+        doomed_pos = np.array([orb.rect.center for orb in doomed], dtype=np.float64)
+        kept_pos = np.array([orb.rect.center for orb in kept], dtype=np.float64)
+        distances = ((doomed_pos[:, None, :] - kept_pos[None, :, :]) ** 2).sum(axis=2)
+        for orb, target in zip(doomed, distances.argmin(axis=1).tolist()):
+            kept[target].value += orb.value
+        self.orbs = kept
+        self._grid_valid = False
+        self.cap_merged += len(doomed)
+        return len(doomed)
+
+    def stats(self) -> dict:
+        """Orb counters as a dict, e.g. for debug overlays"""
+        return {
+            'orbs': len(self.orbs),
+            'value': sum(orb.value for orb in self.orbs),
+            'merged': self.merged,
+            'cap_merged': self.cap_merged,
+        }
+
+    def draw(self, screen:pygame.Surface) -> list[pygame.Rect]:
+        """Draw all experience orbs on the screen, returning the areas drawn"""
+        surface = Experience.surface()
+        return screen.blits([(surface, orb.rect) for orb in self.orbs])
 
     def reset(self) -> None:
-        """Clear all enemies"""
-        self.experience_group.empty()
-        self.all_sprites.empty()
\ No newline at end of file
+        """Clear all experience orbs"""
+        self.orbs.clear()
+        self.grid.clear()
+        self._grid_valid = True
+        self.last_merge = sim_clock.now
@@ -4,16 +4,26 @@ import math
 from entities.player.player import Player
 from entities.enemys.base_enemy import BaseEnemy
 from typing import Optional
+from utils.settings import LAYER_PROJECTILES, PROJECTILE_POOL_CAPACITY, PROJECTILE_POOL_WARMUP
+from utils.object_pool import ObjectPool
+from utils.spatial_hash import nearest_sprite
+from managers.projectile_store import ProjectileStore
+from utils.sim_clock import sim_clock
 class ProjectileManager:
     """
     Handles projectile creation, tracking, and updates.
     """
-    def __init__(self, player:Player, screen_width:float, screen_height:float) -> None:
+    def __init__(self, player:Player, screen_width:float, screen_height:float, render_group:Optional[pygame.sprite.LayeredUpdates] = None) -> None:
         self.player = player
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.projectiles = pygame.sprite.Group()
-        self.all_sprites = pygame.sprite.Group()
+        # Array-backed motion, lifetime and culling of every tracked projectile
+        self.store = ProjectileStore()
+        # Killed projectiles return here and are reinitialized on the next shot
+        self.pools: dict[type, ObjectPool] = {}
+        # Long-lived render registry; projectiles leave it when killed
+        self.all_sprites = render_group if render_group is not None else pygame.sprite.LayeredUpdates()
         self.enemy_projectiles = pygame.sprite.Group()
         self.player_projectiles = pygame.sprite.Group()
 
@@ -24,7 +34,8 @@ class ProjectileManager:
             modifications = getattr(shooter, 'projectile_modifications', {})
             if modifications:
                 # Use enhanced projectile with modifications
-                projectile = Projectile(
+                projectile = self.acquire(
+                    Projectile,
                     shooter.rect.centerx, 
                     shooter.rect.centery,
                     target_x, 
@@ -38,7 +49,8 @@ class ProjectileManager:
                 )
             else:
                 # Use basic projectile
-                projectile = Projectile(
+                projectile = self.acquire(
+                    Projectile,
                     shooter.rect.centerx, 
                     shooter.rect.centery,
                     target_x, 
@@ -54,14 +66,37 @@ class ProjectileManager:
             else:
                 self.enemy_projectiles.add(projectile)
 
-            self.projectiles.add(projectile)
-            self.all_sprites.add(projectile)
+            self.add_projectile(projectile)
             
             # Update last shot time
-            shooter.last_shot = pygame.time.get_ticks()
+            shooter.last_shot = sim_clock.now
             return projectile
             
         return None
+
+    def acquire(self, projectile_class:type, *args, **kwargs) -> Projectile:
+        """Take a projectile of the given class from its pool, initialized with the given arguments"""
+        pool = self.pools.get(projectile_class)
+        if pool is None:
+            pool = ObjectPool(projectile_class, PROJECTILE_POOL_CAPACITY, PROJECTILE_POOL_WARMUP)
+            self.pools[projectile_class] = pool
+        return pool.acquire(*args, **kwargs)
+
+    def spawn(self, projectile_class:type, *args, **kwargs) -> Projectile:
+        """Acquire a pooled projectile and start tracking it (used by abilities)"""
+        projectile = self.acquire(projectile_class, *args, **kwargs)
+        self.add_projectile(projectile)
+        return projectile
+
+    def pool_stats(self) -> dict[str, dict]:
+        """Pool counters per projectile class"""
+        return {cls.__name__: pool.stats() for cls, pool in self.pools.items()}
+
+    def add_projectile(self, projectile:Projectile) -> None:
+        """Track a projectile, register it for rendering and hand its motion to the store"""
+        self.projectiles.add(projectile)
+        self.all_sprites.add(projectile, layer=LAYER_PROJECTILES)
+        self.store.add(projectile)
             
     def handle_auto_shooting(self, enemies:list[BaseEnemy]) -> Optional[Projectile]:
         """Automatically target nearest enemy and create projectile"""
@@ -69,22 +104,12 @@ class ProjectileManager:
             return None
             
         # Find the closest enemy to target
-        closest_enemy = None
-        min_distance = float('inf')
-        
-        for enemy in enemies:
-            # Calculate distance between player and this enemy
-            dx = enemy.rect.centerx - self.player.rect.centerx
-            dy = enemy.rect.centery - self.player.rect.centery
-            distance = (dx**2 + dy**2)**0.5  # Euclidean distance
-
-            # Update closest enemy if this one is closer
-            if distance < min_distance:
-                min_distance = distance
-                closest_enemy = enemy
-                angle = math.degrees(math.atan2(-dy, dx))  # Calculate angle to enemy
+        closest_enemy = nearest_sprite(enemies, self.player.rect.center)
         
         if closest_enemy:
+            dx = closest_enemy.rect.centerx - self.player.rect.centerx
+            dy = closest_enemy.rect.centery - self.player.rect.centery
+            angle = math.degrees(math.atan2(-dy, dx))  # Calculate angle to enemy
             return self.create_projectile(self.player, closest_enemy.rect.centerx, closest_enemy.rect.centery,is_player=True, angle=angle)
 
         return None
@@ -108,12 +133,15 @@ class ProjectileManager:
 
     def update(self, enemies:list[BaseEnemy]=None, *args, **kwargs)-> None:
         """Update all projectiles, passing enemies for homing projectiles"""
+        # Per-projectile work that can't be batched: homing and animation
         for projectile in self.projectiles:
-            if hasattr(projectile, 'update'):
-                if enemies is not None:
-                    projectile.update(enemies, *args, **kwargs)
-                else:
-                    projectile.update(*args, **kwargs)
+            if enemies is not None:
+                projectile.update(enemies, *args, **kwargs)
+            else:
+                projectile.update(*args, **kwargs)
+        
+        # Movement, lifetime expiry and off-screen culling for all at once
+        self.store.step(sim_clock.now)
         
     def draw(self, screen:pygame.Surface) -> None:
         """Draw all projectiles"""
@@ -127,5 +155,8 @@ class ProjectileManager:
     
     def reset(self) -> None:
         """Clear all projectiles"""
+        self.all_sprites.remove(self.projectiles)
+        self.store.clear()
         self.projectiles.empty()
-        self.all_sprites.empty()
\ No newline at end of file
+        self.player_projectiles.empty()
+        self.enemy_projectiles.empty()
\ No newline at end of file
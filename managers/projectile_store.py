@@ -0,0 +1,108 @@
+import numpy as np
+import pygame
+from utils.settings import PROJECTILE_STORE_CAPACITY
+
+
+class ProjectileStore:
+    """
+    Struct-of-arrays store that integrates every projectile at once.
+    Float positions, velocities, lifetimes and culling bounds live in NumPy
+    arrays; one step per tick advances them, expires lifetimes, culls
+    projectiles that left the screen and syncs the surviving rects.
+    Attached projectiles read and write dx/dy through ArrayFields.
+    """
+    def __init__(self, capacity: int = PROJECTILE_STORE_CAPACITY) -> None:
+        self.count = 0
+        self.sprites: list[pygame.sprite.Sprite] = []
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        # Rect edges relative to the center: left, top, right, bottom
+        self.edges = np.zeros((capacity, 4), dtype=np.int64)
+        # Culling area: min x, min y, max x, max y
+        self.bounds = np.zeros((capacity, 4), dtype=np.float64)
+        self.expires = np.full(capacity, np.inf)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self) -> None:
+        capacity = len(self.pos) * 2
+        for name in ('pos', 'vel', 'edges', 'bounds', 'expires'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, projectile: pygame.sprite.Sprite) -> None:
+        """Move a projectile's motion state into the store."""
+        if projectile.store is not None:
+            return
+        if self.count == len(self.pos):
+            self._grow()
+        slot = self.count
+        rect = projectile.rect
+        self.pos[slot] = rect.center
+        self.vel[slot] = (projectile.dx, projectile.dy)
+        self._set_edges(slot, rect)
+        margin = projectile.cull_margin
+        self.bounds[slot] = (-margin, -margin, projectile.screen_width + margin, projectile.screen_height + margin)
+        lifetime = getattr(projectile, 'lifetime', None)
+        self.expires[slot] = np.inf if lifetime is None else projectile.creation_time + lifetime
+        self.sprites.append(projectile)
+        self.count += 1
+        projectile.attach_store(self, slot)
+
+    def _set_edges(self, slot: int, rect: pygame.Rect) -> None:
+        self.edges[slot] = (rect.left - rect.centerx, rect.top - rect.centery,
+                            rect.right - rect.centerx, rect.bottom - rect.centery)
+
+    def sync_rect(self, projectile: pygame.sprite.Sprite) -> None:
+        """Culling follows the rect's size; call after replacing a stored projectile's rect."""
+        if projectile.store is self:
+            self._set_edges(projectile.store_slot, projectile.rect)
+
+    def remove(self, projectile: pygame.sprite.Sprite) -> None:
+        """Hand a projectile's state back to the sprite and free its slot."""
+        if projectile.store is not self:
+            return
+        slot = projectile.store_slot
+        projectile.detach_store()
+        last = self.count - 1
+        if slot != last:
+            moved = self.sprites[last]
+            self.sprites[slot] = moved
+            for array in (self.pos, self.vel, self.edges, self.bounds, self.expires):
+                array[slot] = array[last]
+            moved.store_slot = slot
+        self.sprites.pop()
+        self.count -= 1
+
+    def clear(self) -> None:
+        """Detach every projectile."""
+        while self.count:
+            self.remove(self.sprites[-1])
+
+    def step(self, now: int) -> None:
+        """Advance every projectile and kill the expired and off-screen ones."""
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        pos += self.vel[:n]
+        # pygame rounds float centers half away from zero
+        centers = np.copysign(np.floor(np.abs(pos) + 0.5), pos)
+        edges = centers[:, (0, 1, 0, 1)] + self.edges[:n]
+        bounds = self.bounds[:n]
+        dead = (
+            (edges[:, 2] < bounds[:, 0]) | (edges[:, 0] > bounds[:, 2]) |
+            (edges[:, 3] < bounds[:, 1]) | (edges[:, 1] > bounds[:, 3]) |
+            (now > self.expires[:n])
+        )
+
+        # Collect first: killing reorders the slots
+        doomed = [self.sprites[i] for i in np.flatnonzero(dead)]
+        for sprite, center, is_dead in zip(self.sprites, centers.astype(np.int64).tolist(), dead.tolist()):
+            if not is_dead:
+                sprite.rect.center = center
+        for sprite in doomed:
+            sprite.kill()
@@ -0,0 +1,114 @@
+import heapq
+import itertools
+import pygame
+from typing import Callable, Optional, Tuple
+from utils.settings import BURN_TICK_INTERVAL
+from entities.enemys.status_effects import StatusEffects
+from utils.sim_clock import sim_clock
+
+
+class StatusEffectScheduler:
+    """
+    Applies timed status effects to enemies (freeze, burn, stun, charm, shock)
+    through their StatusEffects component and lifts them when they run out.
+    Expiries and burn ticks sit in a min-heap keyed by due time, so each
+    update only touches the effects that are due instead of scanning every
+    enemy. Re-applying an effect extends it;
+    heap entries made obsolete by that are skipped when they come up.
+    """
+    # How each effect is lifted from an enemy's StatusEffects
+    _expirers = {
+        'freeze': StatusEffects.unfreeze,
+        'stun': StatusEffects.unstun,
+        'burn': StatusEffects.extinguish,
+        'charm': StatusEffects.uncharm,
+        'shock': StatusEffects.unshock,
+    }
+
+    def __init__(self, on_burn_kill: Optional[Callable[[pygame.sprite.Sprite], None]] = None) -> None:
+        self.on_burn_kill = on_burn_kill
+        self._heap: list[tuple] = []
+        self._sequence = itertools.count()
+        # Current end time of every running effect, keyed by (enemy, effect)
+        self._ends: dict[tuple, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def _schedule(self, due: int, action: str, enemy: pygame.sprite.Sprite, effect: str) -> None:
+        heapq.heappush(self._heap, (due, next(self._sequence), action, effect, enemy))
+
+    def _start(self, enemy: pygame.sprite.Sprite, effect: str, now: int, duration: int) -> bool:
+        """Record the effect's end time; returns False if it was already running."""
+        key = (enemy, effect)
+        running = key in self._ends
+        end = now + duration
+        self._ends[key] = max(end, self._ends[key]) if running else end
+        self._schedule(self._ends[key], 'expire', enemy, effect)
+        return not running
+
+    def is_active(self, enemy: pygame.sprite.Sprite, effect: str) -> bool:
+        return (enemy, effect) in self._ends
+
+    def freeze(self, enemy: pygame.sprite.Sprite, duration: int, now: Optional[int] = None) -> None:
+        """Stop the enemy completely for duration ms."""
+        now = sim_clock.now if now is None else now
+        self._start(enemy, 'freeze', now, duration)
+        enemy.status.freeze()
+
+    def stun(self, enemy: pygame.sprite.Sprite, duration: int, now: Optional[int] = None) -> None:
+        """Set the enemy's speed to 0 for duration ms."""
+        now = sim_clock.now if now is None else now
+        self._start(enemy, 'stun', now, duration)
+        enemy.status.stun()
+
+    def burn(self, enemy: pygame.sprite.Sprite, duration: int, damage: float, now: Optional[int] = None) -> None:
+        """Deal damage every BURN_TICK_INTERVAL ms for duration ms."""
+        now = sim_clock.now if now is None else now
+        enemy.status.ignite(damage)
+        if self._start(enemy, 'burn', now, duration):
+            self._schedule(now + BURN_TICK_INTERVAL, 'tick', enemy, 'burn')
+
+    def charm(self, enemy: pygame.sprite.Sprite, duration: int, tint: Optional[Tuple[int, int, int]] = None,
+              now: Optional[int] = None) -> None:
+        """Keep the enemy from chasing the player for duration ms."""
+        now = sim_clock.now if now is None else now
+        self._start(enemy, 'charm', now, duration)
+        enemy.status.charm(tint)
+
+    def shock(self, enemy: pygame.sprite.Sprite, duration: int, now: Optional[int] = None) -> None:
+        """Mark the enemy as shocked for duration ms."""
+        now = sim_clock.now if now is None else now
+        self._start(enemy, 'shock', now, duration)
+        enemy.status.shock()
+
+    def update(self, now: Optional[int] = None) -> None:
+        """Run every expiry and burn tick that is due."""
+        now = sim_clock.now if now is None else now
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due, _, action, effect, enemy = heapq.heappop(heap)
+            key = (enemy, effect)
+            end = self._ends.get(key)
+            if end is None:
+                continue
+            if not enemy.alive():
+                del self._ends[key]
+                continue
+            if action == 'expire':
+                # Stale if the effect was extended after this was scheduled
+                if due == end:
+                    del self._ends[key]
+                    self._expirers[effect](enemy.status)
+            elif due < end:  # burn tick
+                if enemy.take_damage(enemy.status.burn_damage):
+                    del self._ends[key]
+                    if self.on_burn_kill:
+                        self.on_burn_kill(enemy)
+                    continue
+                self._schedule(due + BURN_TICK_INTERVAL, 'tick', enemy, 'burn')
+
+    def clear(self) -> None:
+        """Forget every running effect."""
+        self._heap.clear()
+        self._ends.clear()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Pack every sprite sheet listed in utils/animations.py into texture atlases.
+
+Frames are sliced and scaled exactly like the game does at runtime, then
+packed into one or a few PNG atlases next to a JSON manifest holding the frame
+rects, target sizes and frame delays. AssetCache.load_atlas reads the result
+once at startup.
+
+Usage (from the project root):
+    python scripts/build_atlas.py
+"""
+
+import json
+import os
+import sys
+
+# Slicing uses convert_alpha, which needs a (hidden) display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)
+
+import pygame
+from utils.animations import ANIMATIONS
+from utils.asset_cache import AssetCache
+from utils.settings import ATLAS_MANIFEST, ATLAS_MAX_SIZE
+
+
+def pack_frames(frames: list[tuple[str, int, pygame.Surface]], max_size: int) -> list[list[tuple]]:
+    """
+    Shelf-pack frames into as few atlases as possible.
+    Returns one list of (path, frame index, surface, (x, y)) per atlas.
+    """
+    atlases = [[]]
+    x = y = shelf_height = 0
+    # Tallest frames first keeps the shelves tight
+    for path, index, frame in sorted(frames, key=lambda item: item[2].get_height(), reverse=True):
+        width, height = frame.get_size()
+        if width > max_size or height > max_size:
+            raise ValueError(f"Frame {index} of {path} is larger than the atlas ({max_size}px)")
+        if x + width > max_size:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        if y + height > max_size:
+            atlases.append([])
+            x = y = shelf_height = 0
+        atlases[-1].append((path, index, frame, (x, y)))
+        x += width
+        shelf_height = max(shelf_height, height)
+    return atlases
+
+
+def build_atlas(manifest_path: str = ATLAS_MANIFEST, max_size: int = ATLAS_MAX_SIZE) -> dict:
+    """Build the atlas images and manifest, returning the manifest."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    frames = []
+    for path, animation in ANIMATIONS.items():
+        sheet_frames = AssetCache.get_frames(path, animation['size'], animation['frames'], animation['scale_sheet'])
+        frames.extend((path, index, frame) for index, frame in enumerate(sheet_frames))
+
+    atlas_dir = os.path.dirname(manifest_path)
+    os.makedirs(atlas_dir, exist_ok=True)
+
+    manifest = {'atlases': [], 'animations': {}}
+    for path, animation in ANIMATIONS.items():
+        manifest['animations'][path] = {
+            'atlas': None,
+            'size': list(animation['size']),
+            'frame_delay': animation['frame_delay'],
+            'scale_sheet': animation['scale_sheet'],
+            'rects': [None] * animation['frames'],
+        }
+
+    for atlas_index, placements in enumerate(pack_frames(frames, max_size)):
+        width = max(x + frame.get_width() for _, _, frame, (x, _) in placements)
+        height = max(y + frame.get_height() for _, _, frame, (_, y) in placements)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        for path, index, frame, (x, y) in placements:
+            # The atlas starts fully transparent, so MAX copies pixels and alpha unchanged
+            atlas.blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            entry = manifest['animations'][path]
+            if entry['atlas'] not in (None, atlas_index):
+                raise ValueError(f"Frames of {path} ended up in different atlases, raise ATLAS_MAX_SIZE")
+            entry['atlas'] = atlas_index
+            entry['rects'][index] = [x, y, frame.get_width(), frame.get_height()]
+
+        atlas_name = f"atlas_{atlas_index}.png"
+        pygame.image.save(atlas, os.path.join(atlas_dir, atlas_name))
+        manifest['atlases'].append(atlas_name)
+
+    with open(manifest_path, 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+if __name__ == "__main__":
+    manifest = build_atlas()
+    frame_count = sum(len(entry['rects']) for entry in manifest['animations'].values())
+    print(f"Packed {frame_count} frames from {len(manifest['animations'])} sheets "
+          f"into {len(manifest['atlases'])} atlas(es) -> {ATLAS_MANIFEST}")
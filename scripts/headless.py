@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Run the game without a window, as fast as the machine allows.
+
+The player is driven by a BotInput, the game clock runs in fixed mode (so a
+seed reproduces the same run) and nothing caps the frame rate. Rendering is
+skipped unless --render-every asks for one frame every N ticks. At the end
+it reports ticks per second, the mean time per tick of each update phase
+and the mean time per rendered frame. --immortal keeps the player alive so
+long runs reach late-game enemy counts.
+
+Usage (from the project root):
+    python scripts/headless.py --seconds 120 --bot kite --seed 1
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# No window and no sound
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)
+
+from game_controller import GameController
+from utils.bot_input import BotInput
+from utils.settings import SIM_TICK_RATE
+from utils.sim_clock import SimClock, sim_clock
+
+
+def run(seconds: float, render_every: int = 0, bot: str = 'kite', seed: int = 0, immortal: bool = False,
+        csv_path: str = None) -> dict:
+    """Simulate `seconds` of game time and return the run's statistics."""
+    random.seed(seed)
+    sim_clock.configure(SimClock.FIXED)
+    # Throwaway rankings, so runs leave no database behind
+    game = GameController(db_path=":memory:")
+    game.interpolator = None
+    game.input_source = BotInput(bot, seed)
+    state = game.state_manager
+    state.change_state(state.PLAYING)
+    picker = random.Random(seed)
+    timer = game.frame_timer
+    if csv_path:
+        timer.open_csv(csv_path, GameController.TIMING_PHASES, GameController.COUNT_COLUMNS)
+
+    ticks = 0
+    rendered = 0
+    outcome = 'time_up'
+    start = time.perf_counter()
+    for tick in range(int(seconds * SIM_TICK_RATE)):
+        if state.is_state(state.LEVEL_UP):
+            # Take a random upgrade and carry on
+            if state.upgrade_options:
+                choice = picker.choice(state.upgrade_options)
+                game.ability_manager.upgrade_ability(choice['ability'])
+            state.change_state(state.PLAYING)
+        elif not state.is_state(state.PLAYING):
+            outcome = 'won' if state.is_state(state.GAME_WON) else 'died'
+            break
+
+        if immortal:
+            game.player.hp = game.player.max_hp
+        game.simulate(1)
+        ticks += 1
+
+        if render_every and tick % render_every == 0:
+            game.render_screen()
+            # Only frames drawn while playing are timed
+            if 'render' in timer.frame:
+                rendered += 1
+        timer.end_frame(**game.entity_counts())
+    wall = time.perf_counter() - start
+    timer.close_csv()
+
+    phases = timer.report()
+    phases.pop('render', None)
+    if rendered:
+        phases['render'] = timer.totals.get('render', 0.0) * 1000 / rendered
+    return {
+        'outcome': outcome,
+        'ticks': ticks,
+        'simulated_seconds': round(game.elapsed_time, 3),
+        'wall_seconds': round(wall, 3),
+        'ticks_per_second': round(ticks / wall, 1) if wall else 0.0,
+        'realtime_factor': round(game.elapsed_time / wall, 2) if wall else 0.0,
+        'level': game.player.level,
+        'enemies': len(game.enemy_manager.enemies),
+        'projectiles': len(game.projectile_manager.store),
+        'orbs': len(game.experience_manager),
+        'phase_ms': {phase: round(ms, 4) for phase, ms in phases.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the game headless at maximum speed.")
+    parser.add_argument('--seconds', type=float, default=60, help="game time to simulate")
+    parser.add_argument('--render-every', type=int, default=0, metavar='N',
+                        help="render one frame every N ticks (0: never)")
+    parser.add_argument('--bot', choices=BotInput.MODES, default='kite', help="how the player moves")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--immortal', action='store_true', help="keep the player at full health")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--csv', metavar='PATH', help="write one row of span timings per tick to PATH")
+    args = parser.parse_args()
+
+    report = run(args.seconds, args.render_every, args.bot, args.seed, args.immortal, args.csv)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['outcome']}: {report['ticks']} ticks ({report['simulated_seconds']} s of game time) "
+          f"in {report['wall_seconds']} s -> {report['ticks_per_second']} ticks/s, "
+          f"{report['realtime_factor']}x real time")
+    print(f"level {report['level']}, {report['enemies']} enemies, {report['projectiles']} projectiles, "
+          f"{report['orbs']} orbs")
+    for phase, ms in report['phase_ms'].items():
+        unit = 'ms/frame' if phase == 'render' else 'ms/tick'
+        print(f"  {phase:<26} {ms:8.3f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import pygame
+from typing import Callable, Iterable
+
+# A draw step paints onto the screen and returns the areas it touched
+DrawStep = Callable[[pygame.Surface], list[pygame.Rect]]
+
+
+class DirtyRectRenderer:
+    """
+    Play-state renderer that only redraws the parts of the screen that changed.
+    Each frame the background is restored under everything drawn on the previous
+    frame, the new frame is drawn on top and only those areas are sent to the
+    display with pygame.display.update(rects) instead of a full flip.
+    """
+    def __init__(self, screen: pygame.Surface, background: pygame.Surface) -> None:
+        self.screen = screen
+        self.background = background
+        self._previous_rects: list[pygame.Rect] = []
+        self._full_redraw = True
+
+    def invalidate(self) -> None:
+        """Repaint the whole screen on the next frame (e.g. after a menu covered it)."""
+        self._full_redraw = True
+
+    @staticmethod
+    def draw_sprites(sprites: Iterable[pygame.sprite.Sprite]) -> DrawStep:
+        """Draw step blitting every sprite and returning their rects."""
+        return lambda screen: screen.blits([(sprite.image, sprite.rect) for sprite in sprites])
+
+    def render(self, steps: Iterable[DrawStep]) -> None:
+        """Draw a frame from the given steps, in order, and update the display."""
+        screen_rect = self.screen.get_rect()
+
+        if self._full_redraw:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            # Erase last frame: background back under everything drawn on it
+            for rect in self._previous_rects:
+                self.screen.blit(self.background, rect, rect)
+
+        drawn = []
+        for step in steps:
+            for rect in step(self.screen):
+                rect = rect.clip(screen_rect)
+                if rect.width and rect.height:
+                    drawn.append(rect)
+
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            # Old areas must be pushed too, so erased sprites disappear from the display
+            pygame.display.update(self._previous_rects + drawn)
+        self._previous_rects = drawn
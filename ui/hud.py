@@ -1,91 +1,100 @@
 import pygame
+from typing import Optional
 from utils.settings import *
 from entities.player.player import Player
 from managers.ability_manager import AbilityManager
 from entities.enemys.base_boss import BaseBoss
+from utils.text_cache import text_cache
 class HUD:
     """Manages the heads-up display for game information."""
     def __init__(self, player:Player, screen:pygame.Surface) -> None:
         self.player = player
         self.screen = screen
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        # Font sizes; rendered text comes from the shared text cache
+        self.font_size = 36
+        self.small_font_size = 24
     
-    def draw(self, clock:int, ability_manager:AbilityManager=None) -> None:
-        """Render all HUD elements."""
-        self._draw_health_bar()
-        self._draw_level_and_exp()
-        self._draw_time(clock)
+    def draw(self, clock:int, ability_manager:AbilityManager=None) -> list[pygame.Rect]:
+        """Render all HUD elements, returning the screen areas that were drawn."""
+        rects = self._draw_health_bar()
+        rects += self._draw_level_and_exp()
+        rects += self._draw_time(clock)
         if ability_manager:
-            self._draw_active_abilities(ability_manager)
+            rects += self._draw_active_abilities(ability_manager)
+        return rects
     
-    def _draw_health_bar(self) -> None:
+    def _draw_health_bar(self) -> list[pygame.Rect]:
         """Draw player's health bar."""
         bar_width = 200
         bar_height = 20
         fill_width = int((self.player.hp / self.player.max_hp) * bar_width)
         
         # Outline
-        pygame.draw.rect(self.screen, WHITE, 
+        outline_rect = pygame.draw.rect(self.screen, WHITE, 
             (10, 10, bar_width, bar_height), 2)
         
         # Fill
         pygame.draw.rect(self.screen, RED, 
             (10, 10, fill_width, bar_height))
+        return [outline_rect]
     
-    def _draw_level_and_exp(self)-> None:
+    def _draw_level_and_exp(self)-> list[pygame.Rect]:
         """Display player's level and experience."""
-        level_text = self.font.render(
+        level_text = text_cache.render(
             f"Level: {self.player.level}", 
-            True, WHITE
+            self.font_size, WHITE
         )
-        exp_text = self.font.render(
+        exp_text = text_cache.render(
             f"EXP: {self.player.exp}/100", 
-            True, WHITE
+            self.font_size, WHITE
         )
         
-        self.screen.blit(level_text, (10, 40))
-        self.screen.blit(exp_text, (10, 70))
+        return [
+            self.screen.blit(level_text, (10, 40)),
+            self.screen.blit(exp_text, (10, 70)),
+        ]
     
-    def _draw_time(self, clock:int) -> None:
+    def _draw_time(self, clock:int) -> list[pygame.Rect]:
         """Display the current game time in minutes:seconds format."""
         # Convert to minutes and seconds
         minutes = int(clock) // 60
         seconds = int(clock) % 60
         
-        time_text = self.font.render(
+        time_text = text_cache.render(
             f"Time: {minutes:02d}:{seconds:02d}", 
-            True, WHITE
+            self.font_size, WHITE
         )
         
-        self.screen.blit(time_text, (10, 100))
+        return [self.screen.blit(time_text, (10, 100))]
     
-    def _draw_active_abilities(self, ability_manager:AbilityManager) -> None:
+    def _draw_active_abilities(self, ability_manager:AbilityManager) -> list[pygame.Rect]:
         """Display active abilities and their status."""
+        rects = []
         y_offset = 140
         
         # Show acquired abilities
         if ability_manager.player_abilities:
-            abilities_text = self.small_font.render("Habilidades Ativas:", True, WHITE)
-            self.screen.blit(abilities_text, (10, y_offset))
+            abilities_text = text_cache.render("Habilidades Ativas:", self.small_font_size, WHITE)
+            rects.append(self.screen.blit(abilities_text, (10, y_offset)))
             y_offset += 25
             
             for ability_name, ability in ability_manager.player_abilities.items():
                 # Show ability name and level
                 ability_text = f"{ability.name} (Nv.{ability.level})"
-                text_surface = self.small_font.render(ability_text, True, WHITE)
-                self.screen.blit(text_surface, (10, y_offset))
+                text_surface = text_cache.render(ability_text, self.small_font_size, WHITE)
+                rects.append(self.screen.blit(text_surface, (10, y_offset)))
                 y_offset += 20
         
         # Show shield status
         if hasattr(self.player, 'has_purring_shield') and self.player.has_purring_shield:
-            shield_text = self.small_font.render("ESCUDO ATIVO", True, CYAN)
-            self.screen.blit(shield_text, (10, y_offset))
+            shield_text = text_cache.render("ESCUDO ATIVO", self.small_font_size, CYAN)
+            rects.append(self.screen.blit(shield_text, (10, y_offset)))
+        return rects
 
-    def draw_boss_health_bar(self, boss:BaseBoss) -> None:
-        """Draw health bar above a boss enemy"""
+    def draw_boss_health_bar(self, boss:BaseBoss) -> Optional[pygame.Rect]:
+        """Draw health bar above a boss enemy, returning the area drawn"""
         if not hasattr(boss, 'is_boss') or not boss.is_boss:
-            return
+            return None
         
         # Defina as dimensões da barra de vida
         bar_width = 150
@@ -101,4 +110,6 @@ class HUD:
         bar_y = top_y
         
         pygame.draw.rect(self.screen, RED, 
-            (bar_x, bar_y, fill_width, bar_height))
\ No newline at end of file
+            (bar_x, bar_y, fill_width, bar_height))
+        # The full bar area, so a shrinking bar is also cleared
+        return pygame.Rect(bar_x, bar_y, bar_width, bar_height)
\ No newline at end of file
@@ -1,44 +1,76 @@
 import pygame
 from utils.settings import *
 from utils.database import DatabaseManager
+from utils.text_cache import text_cache
 import time as tm
 from typing import Optional
 class MenuSystem:
     """Manages different game menus and state transitions."""
     def __init__(self, screen:pygame.Surface, databaseManager: DatabaseManager)->None:
         self.screen = screen
-        self.font_title = pygame.font.Font(None, 64)
-        self.font_menu = pygame.font.Font(None, 48)
+        # Font sizes; rendered text comes from the shared text cache
+        self.title_size = 64
+        self.menu_size = 48
         self.databaseManager = databaseManager
         # Get the actual screen dimensions
         self.width = screen.get_width()
         self.height = screen.get_height()
-    
+        # Prerendered static layers, keyed by (layer name, screen resolution)
+        self._layer_cache: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+
+    def invalidate_cache(self, layer: Optional[str] = None) -> None:
+        """
+        Drop prerendered menu layers so they are rebuilt on the next draw.
+        Call without arguments after the screen changes, or with a layer name
+        when its content changes (e.g. 'game_over' after a new ranking entry).
+        """
+        self.width = self.screen.get_width()
+        self.height = self.screen.get_height()
+        if layer is None:
+            self._layer_cache.clear()
+        else:
+            for key in [key for key in self._layer_cache if key[0] == layer]:
+                del self._layer_cache[key]
+
+    def _get_layer(self, layer: str, build) -> pygame.Surface:
+        """Return a cached layer for the current resolution, building it on first use."""
+        size = self.screen.get_size()
+        # Builders lay out with width/height, keep them in sync with the key
+        self.width, self.height = size
+        key = (layer, size)
+        surface = self._layer_cache.get(key)
+        if surface is None:
+            surface = build()
+            self._layer_cache[key] = surface
+        return surface
+
+    def _new_layer(self) -> pygame.Surface:
+        """Create an opaque full-screen layer cleared to black."""
+        layer = pygame.Surface((self.width, self.height)).convert()
+        layer.fill(BLACK)
+        return layer
+
     def draw_start_menu(self)->None:
         """Render the game's start menu with a fullscreen custom image only."""
-        self.screen.fill(BLACK)
-        # Load and scale the menu image to fit the screen
+        self.screen.blit(self._get_layer('start_menu', self._build_start_menu), (0, 0))
+        # Não exibe texto adicional, pois já está na imagem
+
+    def _build_start_menu(self) -> pygame.Surface:
+        """Load and scale the menu image to fit the screen."""
+        layer = self._new_layer()
         menu_img = pygame.image.load('assets/images/ui/menu/Menu.png').convert_alpha()
         scaled_img = pygame.transform.smoothscale(menu_img, (self.width, self.height))
-        self.screen.blit(scaled_img, (0, 0))
-        # Não exibe texto adicional, pois já está na imagem
+        layer.blit(scaled_img, (0, 0))
+        return layer
     
     def draw_input_name(self, current_name:str, player_level:int, max_length:Optional[int]=10) -> None:
         """Render the name input screen."""
-        self.screen.fill(BLACK)
+        self.screen.blit(self._get_layer('input_name', self._build_input_name), (0, 0))
 
-        game_over = self.font_title.render(
-            "Game Over",
-            True, RED
-        )
-        game_over_rect = game_over.get_rect(
-            center=(self.width//2, self.height//9)
-        )
-        
         # Level Reached
-        level_text = self.font_menu.render(
+        level_text = text_cache.render(
             f"You reached Level {player_level}", 
-            True, WHITE
+            self.menu_size, WHITE
         )
         level_rect = level_text.get_rect(
             center=(self.width//2, self.height//9 + self.height//18)
@@ -48,136 +80,159 @@ class MenuSystem:
             current_name = ""
 
         current_name = str(current_name)
-        
-        # Title
-        title = self.font_title.render(
-            "Enter Your Name", 
-            True, WHITE
-        )
-        title_rect = title.get_rect(
-            center=(self.width//2, self.height//3 + self.height//18)
-        )        # Input Box
-
-        input_box = pygame.Rect(self.width//2 - 150, self.height//2-50, 300, 50)
-        pygame.draw.rect(self.screen, BLUE, input_box, 0, 10)
-        pygame.draw.rect(self.screen, WHITE, input_box, 3, 10)
 
+        input_box = self._input_box_rect()
         if current_name:
-            name_text = self.font_menu.render(
+            name_text = text_cache.render(
                 current_name, 
-                True, WHITE
+                self.menu_size, WHITE
             )
             name_rect = name_text.get_rect(
                 center=input_box.center
             )
             self.screen.blit(name_text, name_rect)
 
-        limit_text = self.font_menu.render(
-            f"{len(current_name)}/{max_length} characters",
-            True, GREY if len(current_name) < max_length else RED
+        limit_text = text_cache.render(
+            f"{len(current_name)}/{max_length} characters", 
+            self.menu_size, GREY if len(current_name) < max_length else RED
         )
 
         limit_rect = limit_text.get_rect(
             center=(self.width//2, self.height//2 + 30)
         )
+
+        self.screen.blit(level_text, level_rect)
+        self.screen.blit(limit_text, limit_rect)
+
+    def _input_box_rect(self) -> pygame.Rect:
+        """Area of the name input box."""
+        return pygame.Rect(self.width//2 - 150, self.height//2-50, 300, 50)
+
+    def _build_input_name(self) -> pygame.Surface:
+        """Static part of the name input screen: titles, input box and instructions."""
+        layer = self._new_layer()
+
+        game_over = text_cache.render(
+            "Game Over", 
+            self.title_size, RED
+        )
+        game_over_rect = game_over.get_rect(
+            center=(self.width//2, self.height//9)
+        )
+
+        # Title
+        title = text_cache.render(
+            "Enter Your Name", 
+            self.title_size, WHITE
+        )
+        title_rect = title.get_rect(
+            center=(self.width//2, self.height//3 + self.height//18)
+        )
+
+        # Input Box
+        input_box = self._input_box_rect()
+        pygame.draw.rect(layer, BLUE, input_box, 0, 10)
+        pygame.draw.rect(layer, WHITE, input_box, 3, 10)
+
         # Instructions
-        instructions = self.font_menu.render(
+        instructions = text_cache.render(
             "Press ENTER to Confirm", 
-            True, GREEN
+            self.menu_size, GREEN
         )
         instructions_rect = instructions.get_rect(
             center=(self.width//2, self.height//2 + 100)
         )
-        
 
-        self.screen.blit(game_over, game_over_rect)
-        self.screen.blit(level_text, level_rect)
-        self.screen.blit(title, title_rect)
-        self.screen.blit(limit_text, limit_rect)
-        self.screen.blit(instructions, instructions_rect)
+        layer.blit(game_over, game_over_rect)
+        layer.blit(title, title_rect)
+        layer.blit(instructions, instructions_rect)
+        return layer
 
     def draw_game_over(self, player_level:int)->None:
         """Render the game over screen."""
-        self.screen.fill(BLACK)
-        
-        # Game Over Text
-        game_over = self.font_title.render(
-            "Game Over",
-            True, RED
-        )
-        game_over_rect = game_over.get_rect(
-            center=(self.width//2, self.height//9)
-        )
-        
+        # Titles, rankings and instructions only change when a new score is saved
+        self.screen.blit(self._get_layer('game_over', self._build_game_over), (0, 0))
+
         # Level Reached
-        level_text = self.font_menu.render(
+        level_text = text_cache.render(
             f"You reached Level {player_level}", 
-            True, WHITE
+            self.menu_size, WHITE
         )
         level_rect = level_text.get_rect(
             center=(self.width//2, self.height//6)
         )
-        
-        ranking_text = self.font_menu.render(
-            "Top 10 Rankings:",
-            True, WHITE
+        self.screen.blit(level_text, level_rect)
+
+    def _build_game_over(self) -> pygame.Surface:
+        """Static part of the game over screen, including the current rankings."""
+        layer = self._new_layer()
+
+        # Game Over Text
+        game_over = text_cache.render(
+            "Game Over", 
+            self.title_size, RED
+        )
+        game_over_rect = game_over.get_rect(
+            center=(self.width//2, self.height//9)
+        )
+
+        ranking_text = text_cache.render(
+            "Top 10 Rankings:", 
+            self.menu_size, WHITE
         )
         ranking_rect = ranking_text.get_rect(
             center=(self.width//2, self.height//9 + self.height//9)
         )
 
-        self.screen.blit(ranking_text, ranking_rect)
+        layer.blit(ranking_text, ranking_rect)
         # # Fetch and display rankings
         rankings = self.databaseManager.listar_rankings()
         y_offset = 0
         for i, (name, time) in enumerate(rankings):
             time_format = "%M:%S" if time < 3600 else "%H:%M:%S"
             time_str = tm.strftime(time_format, tm.gmtime(time))
-            rank_text = self.font_menu.render(
+            rank_text = text_cache.render(
                 f"{i + 1}. {name} - {time_str}", 
-                True, WHITE
+                self.menu_size, WHITE
             )
             rank_rect = rank_text.get_rect(
                 center=(self.width//2, self.height//9 + self.height//6 + y_offset)
             )
-            self.screen.blit(rank_text, rank_rect)
+            layer.blit(rank_text, rank_rect)
             y_offset += self.height // 18
-            
 
         # Restart Instructions
-        restart_text = self.font_menu.render(
+        restart_text = text_cache.render(
             "Press R to Restart", 
-            True, GREEN
+            self.menu_size, GREEN
         )
         restart_rect = restart_text.get_rect(
             center=(self.width//2, self.height - 100)
         )
         
         # Quit game instructions
-        quit_text = self.font_menu.render(
+        quit_text = text_cache.render(
             "Press Q to Quit", 
-            True, GREEN
+            self.menu_size, GREEN
         )
         quit_rect = quit_text.get_rect(
             center=(self.width//2, self.height - 50)
         )
         
-        self.screen.blit(quit_text, quit_rect)
-        self.screen.blit(game_over, game_over_rect)
-        self.screen.blit(level_text, level_rect)
-        self.screen.blit(restart_text, restart_rect)
+        layer.blit(quit_text, quit_rect)
+        layer.blit(game_over, game_over_rect)
+        layer.blit(restart_text, restart_rect)
+        return layer
         
     def draw_level_up(self, player_level:int, upgrade_options:list[dict]) -> list[pygame.Rect]:
         """Render the level up screen with upgrade options as cards."""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, built once per resolution
+        self.screen.blit(self._get_layer('level_up_overlay', self._build_level_up_overlay), (0, 0))
         
         # Level Up Title
-        level_up_text = self.font_title.render(
+        level_up_text = text_cache.render(
             f"Level Up! Level {player_level}", 
-            True, GREEN
+            self.title_size, GREEN
         )
         level_up_rect = level_up_text.get_rect(
             center=(self.width//2, self.height//2 - 200)
@@ -185,9 +240,9 @@ class MenuSystem:
         self.screen.blit(level_up_text, level_up_rect)
         
         # Choose Upgrade Text
-        choose_text = self.font_menu.render(
+        choose_text = text_cache.render(
             "Escolha uma habilidade:", 
-            True, WHITE
+            self.menu_size, WHITE
         )
         choose_rect = choose_text.get_rect(
             center=(self.width//2, self.height//2 - 140)
@@ -227,18 +282,18 @@ class MenuSystem:
             pygame.draw.rect(self.screen, WHITE, card_rect, 3, 12)
 
             # Habilidade (nome)
-            name_text = self.font_menu.render(option.get('name', ''), True, WHITE)
+            name_text = text_cache.render(option.get('name', ''), self.menu_size, WHITE)
             name_rect = name_text.get_rect(midtop=(card_rect.centerx, card_rect.top + 16))
             self.screen.blit(name_text, name_rect)
 
             # Descrição (com quebra de linha automática)
-            desc_font = pygame.font.Font(None, 32)
+            desc_font = text_cache.get_font(32)
             desc = option.get('description', '')
             desc_lines = []
             for line in desc.split('\n'):
                 desc_lines.extend(wrap_text(line, desc_font, card_width - 32))
             for j, line in enumerate(desc_lines):
-                desc_text = desc_font.render(line, True, BLACK)
+                desc_text = text_cache.render(line, 32, BLACK)
                 desc_rect = desc_text.get_rect(midtop=(card_rect.centerx, card_rect.top + 60 + j * 28))
                 # Evita desenhar fora do card
                 if desc_rect.bottom <= card_rect.bottom - 36:
@@ -246,56 +301,66 @@ class MenuSystem:
 
             # Nível
             level_str = f"Nível: {option.get('level', 1)}"
-            level_font = pygame.font.Font(None, 36)
-            level_text = level_font.render(level_str, True, GREEN)
+            level_text = text_cache.render(level_str, 36, GREEN)
             level_rect = level_text.get_rect(midbottom=(card_rect.centerx, card_rect.bottom - 16))
             self.screen.blit(level_text, level_rect)
 
             option_rects.append(card_rect)
         
         return option_rects  # Return clickable regions
+
+    def _build_level_up_overlay(self) -> pygame.Surface:
+        """Semi-transparent black layer drawn over the game during level up."""
+        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        return overlay
     
     def draw_game_won(self, player_level:int) -> None:
         """Render the game over screen."""
-        self.screen.fill(BLACK)
-        
-        # Game Over Text
-        game_over = self.font_title.render(
-            "You Win!", 
-            True, BLUE
-        )
-        game_over_rect = game_over.get_rect(
-            center=(self.width//2, self.height//2 - 100)
-        )
-        
+        self.screen.blit(self._get_layer('game_won', self._build_game_won), (0, 0))
+
         # Level Reached
-        level_text = self.font_menu.render(
+        level_text = text_cache.render(
             f"You reached Level {player_level}", 
-            True, WHITE
+            self.menu_size, WHITE
         )
         level_rect = level_text.get_rect(
             center=(self.width//2, self.height//2)
         )
+        self.screen.blit(level_text, level_rect)
+
+    def _build_game_won(self) -> pygame.Surface:
+        """Static part of the game won screen."""
+        layer = self._new_layer()
+
+        # Game Over Text
+        game_over = text_cache.render(
+            "You Win!", 
+            self.title_size, BLUE
+        )
+        game_over_rect = game_over.get_rect(
+            center=(self.width//2, self.height//2 - 100)
+        )
         
         # Restart Instructions
-        restart_text = self.font_menu.render(
+        restart_text = text_cache.render(
             "Press R to Restart", 
-            True, GREEN
+            self.menu_size, GREEN
         )
         restart_rect = restart_text.get_rect(
             center=(self.width//2, self.height//2 + 100)
         )
         
         # Quit game instructions
-        quit_text = self.font_menu.render(
+        quit_text = text_cache.render(
             "Press Q to Quit", 
-            True, RED
+            self.menu_size, RED
         )
         quit_rect = quit_text.get_rect(
             center=(self.width//2, self.height//2 + 150)
         )
         
-        self.screen.blit(quit_text, quit_rect)
-        self.screen.blit(game_over, game_over_rect)
-        self.screen.blit(level_text, level_rect)
-        self.screen.blit(restart_text, restart_rect)
\ No newline at end of file
+        layer.blit(quit_text, quit_rect)
+        layer.blit(game_over, game_over_rect)
+        layer.blit(restart_text, restart_rect)
+        return layer
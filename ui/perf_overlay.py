@@ -0,0 +1,56 @@
+import time
+import pygame
+from typing import Optional
+from utils.settings import WHITE
+from utils.text_cache import text_cache
+from utils.frame_timer import FrameTimer
+
+
+class PerfOverlay:
+    """
+    Debug panel in the top right corner with the rolling mean, p99 and max
+    milliseconds of every timing span plus entity counts. Toggled in game
+    with PERF_OVERLAY_KEY. The text only changes every refresh_ms, both to
+    stay readable and so the overlay itself costs next to nothing.
+    """
+    def __init__(self, screen:pygame.Surface, timer:FrameTimer, refresh_ms:int = 250) -> None:
+        self.screen = screen
+        self.timer = timer
+        self.refresh_ms = refresh_ms
+        self.visible = False
+        self.font_size = 18
+        # Monospaced so the columns line up (None falls back to the default font)
+        self.font_name = pygame.font.match_font('dejavusansmono,couriernew,monospace')
+        self._panel: Optional[pygame.Surface] = None
+        self._refreshed = 0.0
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+        self._panel = None
+
+    def _build(self, counts:dict) -> pygame.Surface:
+        # Numbers change every refresh, so render directly instead of filling the text cache
+        font = text_cache.get_font(self.font_size, self.font_name)
+        lines = [f"{'span':<26}{'mean':>7}{'p99':>7}{'max':>7}"]
+        for phase, window in self.timer.windows.items():
+            lines.append(f"{phase:<26}{window.mean:7.2f}{window.percentile(99):7.2f}{window.max:7.2f}")
+        lines.append("  ".join(f"{name} {value}" for name, value in counts.items()))
+        rendered = [font.render(line, True, WHITE) for line in lines]
+        line_height = font.get_linesize()
+        width = max(surface.get_width() for surface in rendered) + 12
+        panel = pygame.Surface((width, line_height * len(rendered) + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        for i, surface in enumerate(rendered):
+            panel.blit(surface, (6, 6 + i * line_height))
+        return panel
+
+    def draw(self, counts:dict) -> list[pygame.Rect]:
+        """Draw the panel if visible, returning the area drawn"""
+        if not self.visible:
+            return []
+        now = time.perf_counter()
+        if self._panel is None or (now - self._refreshed) * 1000 >= self.refresh_ms:
+            self._panel = self._build(counts)
+            self._refreshed = now
+        rect = self._panel.get_rect(topright=(self.screen.get_width() - 10, 10))
+        return [self.screen.blit(self._panel, rect)]
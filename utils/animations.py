@@ -0,0 +1,33 @@
+# Animation data for every sprite sheet in the game, keyed by its source path.
+# This is the single source of truth used by scripts/build_atlas.py to pack the
+# texture atlas and by AssetCache when the atlas has not been built.
+#   frames:      number of frames laid out horizontally in the sheet
+#   size:        size each frame is scaled to in game
+#   frame_delay: milliseconds per frame (None for sprites that do not animate)
+#   scale_sheet: scale the whole sheet to `size` before slicing (enemy sheets)
+#                instead of slicing at native resolution
+
+ANIMATIONS = {
+    # Player
+    'assets/images/kitty/Gatinho.png': {'frames': 1, 'size': (100, 100), 'frame_delay': None, 'scale_sheet': False},
+    'assets/images/kitty/Gatinho Correndo.png': {'frames': 2, 'size': (100, 100), 'frame_delay': 150, 'scale_sheet': False},
+
+    # Enemies
+    'assets/images/enemys/rat/Rato.png': {'frames': 2, 'size': (100, 100), 'frame_delay': 150, 'scale_sheet': True},
+    'assets/images/enemys/dog/Cachorro.png': {'frames': 2, 'size': (130, 130), 'frame_delay': 200, 'scale_sheet': True},
+    'assets/images/enemys/bottle_spray/Pshpsh.png': {'frames': 2, 'size': (125, 125), 'frame_delay': 200, 'scale_sheet': True},
+    'assets/images/enemys/bird/Pombo.png': {'frames': 2, 'size': (100, 100), 'frame_delay': 100, 'scale_sheet': True},
+    'assets/images/enemys/rumba_boss/Rumba.png': {'frames': 3, 'size': (150, 150), 'frame_delay': 100, 'scale_sheet': True},
+
+    # Projectiles
+    'assets/images/abilities/base/Base.png': {'frames': 6, 'size': (20, 20), 'frame_delay': None, 'scale_sheet': False},
+    'assets/images/enemys/bottle_spray/Projetil.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 150, 'scale_sheet': False},
+    'assets/images/abilities/plant/Planta.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 100, 'scale_sheet': False},
+    'assets/images/abilities/water/Water.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 100, 'scale_sheet': False},
+    'assets/images/abilities/fire/Fogo.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 150, 'scale_sheet': False},
+    'assets/images/abilities/ice/Gelo.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 100, 'scale_sheet': False},
+    'assets/images/abilities/earth/Terra.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 100, 'scale_sheet': False},
+    'assets/images/abilities/lightning/Raio.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 150, 'scale_sheet': False},
+    'assets/images/abilities/metal/Metal.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 50, 'scale_sheet': False},
+    'assets/images/abilities/air/Ar.png': {'frames': 6, 'size': (40, 40), 'frame_delay': 75, 'scale_sheet': False},
+}
@@ -0,0 +1,42 @@
+from typing import Any, Callable, Optional
+
+
+class ArrayField:
+    """
+    Attribute of an object that can be attached to a struct-of-arrays store
+    (EnemySwarm, ProjectileStore). While the object's `<store>` attribute is
+    None the value lives on the object itself; once attached it is read from
+    and written to `store.<array>[<store>_slot]` (one column of it if given).
+    """
+    def __init__(self, array: str, column: Optional[int] = None, cast: Callable[[Any], Any] = float,
+                 store: str = 'store') -> None:
+        self.array = array
+        self.column = column
+        self.cast = cast
+        self.store = store
+        self.slot = store + '_slot'
+        self.private = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.private = '_' + name
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        store = getattr(obj, self.store)
+        if store is None:
+            return getattr(obj, self.private)
+        array = getattr(store, self.array)
+        index = getattr(obj, self.slot)
+        if self.column is None:
+            return self.cast(array[index])
+        return self.cast(array[index, self.column])
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        store = getattr(obj, self.store)
+        if store is None:
+            setattr(obj, self.private, value)
+        elif self.column is None:
+            getattr(store, self.array)[getattr(obj, self.slot)] = value
+        else:
+            getattr(store, self.array)[getattr(obj, self.slot), self.column] = value
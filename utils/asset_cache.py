@@ -0,0 +1,131 @@
+import pygame
+import json
+import os
+import weakref
+from typing import Tuple
+from utils.animations import ANIMATIONS
+from utils.settings import ATLAS_MANIFEST
+
+
+class AssetCache:
+    """
+    Process-wide registry of sprite sheets, sliced animation frames and masks.
+    Each sheet is loaded and sliced once and the resulting frames are shared by
+    every entity that uses it, so they must be treated as read-only.
+    When a texture atlas has been built, frames are served straight from it.
+    """
+    _animations: dict[str, dict] = {}
+    _sheets: dict[tuple, pygame.Surface] = {}
+    _frames: dict[tuple, Tuple[pygame.Surface, ...]] = {}
+    _masks: dict[tuple, Tuple[pygame.mask.Mask, ...]] = {}
+    # Masks live next to their surface and are dropped together with it
+    _surface_masks: "weakref.WeakKeyDictionary[pygame.Surface, pygame.mask.Mask]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def load_atlas(cls, manifest_path: str = ATLAS_MANIFEST) -> bool:
+        """
+        Read the atlas manifest once and register every packed animation, so
+        later frame requests need no further file I/O. Returns False if no
+        atlas was built, in which case sheets are loaded from their PNGs.
+        """
+        if not os.path.exists(manifest_path):
+            return False
+        with open(manifest_path, 'r', encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+
+        atlas_dir = os.path.dirname(manifest_path)
+        atlases = [
+            pygame.image.load(os.path.join(atlas_dir, name)).convert_alpha()
+            for name in manifest['atlases']
+        ]
+        for path, entry in manifest['animations'].items():
+            atlas = atlases[entry['atlas']]
+            frames = tuple(atlas.subsurface(rect) for rect in entry['rects'])
+            animation = {
+                'frames': len(frames),
+                'size': tuple(entry['size']),
+                'frame_delay': entry['frame_delay'],
+                'scale_sheet': entry['scale_sheet'],
+            }
+            cls._animations[path] = animation
+            cls._frames[(path, animation['size'], animation['frames'], animation['scale_sheet'])] = frames
+        return True
+
+    @classmethod
+    def get_animation(cls, path: str) -> dict:
+        """Animation data (frames, size, frame_delay, scale_sheet) of a sprite sheet."""
+        animation = cls._animations.get(path)
+        if animation is None:
+            animation = ANIMATIONS[path]
+        return animation
+
+    @classmethod
+    def get_animation_frames(cls, path: str) -> Tuple[pygame.Surface, ...]:
+        """Frames of a sprite sheet, sliced and sized as described by its animation data."""
+        animation = cls.get_animation(path)
+        return cls.get_frames(path, animation['size'], animation['frames'], animation['scale_sheet'])
+
+    @classmethod
+    def get_sheet(cls, path: str, size: Tuple[int, int]) -> pygame.Surface:
+        """Load a sprite sheet scaled to the given size."""
+        key = (path, tuple(size))
+        sheet = cls._sheets.get(key)
+        if sheet is None:
+            sheet = pygame.transform.scale(pygame.image.load(path).convert_alpha(), size)
+            cls._sheets[key] = sheet
+        return sheet
+
+    @classmethod
+    def get_frames(cls, path: str, size: Tuple[int, int], frame_ammount: int, scale_sheet: bool = True) -> Tuple[pygame.Surface, ...]:
+        """
+        Slice a sprite sheet into frames, each scaled to the given size.
+        With scale_sheet=False the frames are cut from the sheet at its native
+        resolution before scaling (used for the large projectile sheets).
+        """
+        key = (path, tuple(size), frame_ammount, scale_sheet)
+        frames = cls._frames.get(key)
+        if frames is None:
+            if scale_sheet:
+                sheet = cls.get_sheet(path, size)
+            else:
+                sheet = pygame.image.load(path).convert_alpha()
+            frame_width = sheet.get_width() // frame_ammount
+            frame_height = sheet.get_height()
+            frames = tuple(
+                pygame.transform.scale(sheet.subsurface((i * frame_width, 0, frame_width, frame_height)), size)
+                for i in range(frame_ammount)
+            )
+            cls._frames[key] = frames
+        return frames
+
+    @classmethod
+    def get_masks(cls, path: str, size: Tuple[int, int], frame_ammount: int, scale_sheet: bool = True) -> Tuple[pygame.mask.Mask, ...]:
+        """Collision masks matching the frames returned by get_frames."""
+        key = (path, tuple(size), frame_ammount, scale_sheet)
+        masks = cls._masks.get(key)
+        if masks is None:
+            frames = cls.get_frames(path, size, frame_ammount, scale_sheet)
+            masks = tuple(cls.get_mask(frame) for frame in frames)
+            cls._masks[key] = masks
+        return masks
+
+    @classmethod
+    def get_mask(cls, surface: pygame.Surface) -> pygame.mask.Mask:
+        """
+        Collision mask for any surface, computed the first time it is needed
+        and kept for as long as the surface itself is alive.
+        """
+        mask = cls._surface_masks.get(surface)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            cls._surface_masks[surface] = mask
+        return mask
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached asset (e.g. after the display mode changes)."""
+        cls._animations.clear()
+        cls._sheets.clear()
+        cls._frames.clear()
+        cls._masks.clear()
+        cls._surface_masks.clear()
@@ -0,0 +1,68 @@
+import math
+import random
+import pygame
+from typing import Iterable, Optional
+from utils.sim_clock import sim_clock
+
+
+class KeyState:
+    """Stand-in for pygame.key.get_pressed(): indexing by key code tells if it is held."""
+    def __init__(self, pressed: Iterable[int] = ()) -> None:
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class BotInput:
+    """
+    Scripted keyboard for running the game without a player, e.g. headless.
+    Called once per tick with the GameController, returns the held keys:
+      - idle: never moves
+      - circle: walks in a square, changing direction every second
+      - kite: runs away from the nearest close enemy, otherwise wanders
+    """
+    MODES = ('idle', 'circle', 'kite')
+    DIRECTIONS = (pygame.K_d, pygame.K_s, pygame.K_a, pygame.K_w)
+
+    def __init__(self, mode: str = 'kite', seed: Optional[int] = None, flee_radius: float = 200) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown bot mode {mode!r}, expected one of {self.MODES}")
+        self.mode = mode
+        self.flee_radius = flee_radius
+        self.random = random.Random(seed)
+        self._wander = KeyState()
+        self._wander_until = 0
+
+    def __call__(self, game) -> KeyState:
+        if self.mode == 'idle':
+            return KeyState()
+        if self.mode == 'circle':
+            return KeyState([self.DIRECTIONS[sim_clock.now // 1000 % len(self.DIRECTIONS)]])
+        return self.kite(game)
+
+    def kite(self, game) -> KeyState:
+        player = game.player
+        enemy = game.enemy_manager.enemies.nearest(player.rect.center)
+        if enemy is not None:
+            dx = player.rect.centerx - enemy.rect.centerx
+            dy = player.rect.centery - enemy.rect.centery
+            if math.hypot(dx, dy) < self.flee_radius:
+                return self.towards(dx, dy)
+        if sim_clock.now >= self._wander_until:
+            self._wander_until = sim_clock.now + 1000
+            # Drift back towards the middle so the walls don't trap it
+            dx = game.width / 2 - player.rect.centerx + self.random.uniform(-200, 200)
+            dy = game.height / 2 - player.rect.centery + self.random.uniform(-200, 200)
+            self._wander = self.towards(dx, dy)
+        return self._wander
+
+    @staticmethod
+    def towards(dx: float, dy: float) -> KeyState:
+        """Keys moving roughly along (dx, dy)"""
+        keys = []
+        if abs(dx) > 1:
+            keys.append(pygame.K_d if dx > 0 else pygame.K_a)
+        if abs(dy) > 1:
+            keys.append(pygame.K_s if dy > 0 else pygame.K_w)
+        return KeyState(keys)
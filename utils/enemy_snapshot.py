@@ -0,0 +1,89 @@
+import math
+import numpy as np
+import pygame
+from typing import Iterable, Optional, Tuple
+from utils.spatial_hash import IndexedGroup
+
+
+class EnemySnapshot:
+    """
+    NumPy copy of enemy centers taken once per tick, for batched area queries.
+    Queries return arrays of indices into `enemies` (in group order); select()
+    turns them back into enemies, skipping any that left the group since.
+    """
+    def __init__(self, enemies: Iterable[pygame.sprite.Sprite]) -> None:
+        self.group = enemies if isinstance(enemies, pygame.sprite.AbstractGroup) else None
+        self.enemies = list(enemies)
+        self.centers = np.array(
+            [enemy.rect.center for enemy in self.enemies], dtype=np.float64
+        ).reshape(-1, 2)
+
+    def __len__(self) -> int:
+        return len(self.enemies)
+
+    @classmethod
+    def of(cls, enemies: Iterable[pygame.sprite.Sprite]) -> "EnemySnapshot":
+        """The shared snapshot of an EnemyGroup, or a fresh one for any other iterable."""
+        if isinstance(enemies, EnemyGroup):
+            return enemies.snapshot
+        return cls(enemies)
+
+    def _distances_sq(self, center: Tuple[float, float]) -> np.ndarray:
+        offsets = self.centers - np.asarray(center, dtype=np.float64)
+        return np.einsum('ij,ij->i', offsets, offsets)
+
+    def in_radius(self, center: Tuple[float, float], radius: float) -> np.ndarray:
+        """Indices of enemies whose center is within radius of center."""
+        return np.flatnonzero(self._distances_sq(center) <= radius * radius)
+
+    def in_annulus(self, center: Tuple[float, float], inner: float, outer: float) -> np.ndarray:
+        """Indices of enemies whose distance to center is between inner and outer."""
+        distances_sq = self._distances_sq(center)
+        return np.flatnonzero((distances_sq >= inner * inner) & (distances_sq <= outer * outer))
+
+    def in_cone(self, center: Tuple[float, float], angle: float, spread: float, radius: float) -> np.ndarray:
+        """
+        Indices of enemies within radius and at most `spread` degrees off the
+        direction `angle` (degrees, screen coordinates: 0 = right, 90 = down).
+        """
+        offsets = self.centers - np.asarray(center, dtype=np.float64)
+        distances_sq = np.einsum('ij,ij->i', offsets, offsets)
+        direction = np.array([math.cos(math.radians(angle)), math.sin(math.radians(angle))])
+        # cos(offset angle) >= cos(spread), compared without dividing by the distance
+        projections = offsets @ direction
+        inside = (distances_sq <= radius * radius) & (
+            projections >= math.cos(math.radians(spread)) * np.sqrt(distances_sq)
+        )
+        return np.flatnonzero(inside)
+
+    def select(self, indices: np.ndarray) -> list[pygame.sprite.Sprite]:
+        """Enemies at the given indices, skipping those killed since the snapshot."""
+        selected = [self.enemies[i] for i in indices]
+        if self.group is not None:
+            return [enemy for enemy in selected if enemy in self.group]
+        return selected
+
+
+class EnemyGroup(IndexedGroup):
+    """
+    Enemy group with a spatial index for nearest queries and a NumPy snapshot
+    for area queries, both rebuilt at most once per tick.
+    """
+    def __init__(self, *sprites) -> None:
+        self._snapshot: Optional[EnemySnapshot] = None
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        self._snapshot = None
+
+    def invalidate_index(self) -> None:
+        super().invalidate_index()
+        self._snapshot = None
+
+    @property
+    def snapshot(self) -> EnemySnapshot:
+        """Position snapshot matching the current rects of the group members."""
+        if self._snapshot is None:
+            self._snapshot = EnemySnapshot(self)
+        return self._snapshot
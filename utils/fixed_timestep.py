@@ -0,0 +1,86 @@
+import pygame
+from typing import Iterable, Tuple
+from utils.settings import SIM_TICK_RATE, MAX_SIM_STEPS_PER_FRAME
+
+
+class FixedTimestep:
+    """
+    Accumulator that turns variable frame times into a whole number of fixed
+    simulation steps. Speeds in the game are per step, so running the steps
+    the elapsed time calls for keeps the game at the same pace whatever the
+    frame rate. At most max_steps run per frame; time beyond that is dropped
+    (the spiral-of-death guard) so a slow frame can't snowball.
+    """
+    def __init__(self, tick_rate: int = SIM_TICK_RATE, max_steps: int = MAX_SIM_STEPS_PER_FRAME) -> None:
+        self.step_ms = 1000 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        # Counters
+        self.steps = 0         # simulation steps run
+        self.frames = 0        # frames that advanced the accumulator
+        self.dropped_ms = 0.0  # time discarded by the guard
+
+    def advance(self, frame_ms: float) -> int:
+        """Add a frame's time and return how many steps to simulate for it"""
+        self.frames += 1
+        self.accumulator += frame_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            # Keep the fraction so interpolation stays smooth
+            dropped = (steps - self.max_steps) * self.step_ms
+            self.dropped_ms += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_ms
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """How far the current frame is between the last two steps, from 0 to 1"""
+        return self.accumulator / self.step_ms
+
+    def reset(self) -> None:
+        """Drop leftover time, e.g. after the game was paused"""
+        self.accumulator = 0.0
+
+
+class RenderInterpolator:
+    """
+    Draws sprites between their positions at the last two simulation steps.
+    snapshot() records the rect centers before a step; around rendering,
+    begin() moves each rect alpha of the way from the snapshot to where the
+    step left it and end() puts it back. Sprites without a snapshot, that
+    jumped farther than max_jump pixels, or that a pool handed out again
+    since the snapshot (new `generation`), are drawn as is.
+    """
+    def __init__(self, max_jump: int = 64) -> None:
+        self.max_jump = max_jump
+        self._previous: dict[pygame.sprite.Sprite, Tuple[int, Tuple[int, int]]] = {}
+        self._moved: list[Tuple[pygame.sprite.Sprite, Tuple[int, int]]] = []
+
+    def snapshot(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        # Pooled sprites are reused, so remember which life the position belongs to
+        self._previous = {sprite: (getattr(sprite, 'generation', 0), sprite.rect.center) for sprite in sprites}
+
+    def clear(self) -> None:
+        self._previous = {}
+
+    def begin(self, alpha: float) -> None:
+        """Move every snapshotted sprite to its interpolated position"""
+        max_jump = self.max_jump
+        for sprite, (generation, (px, py)) in self._previous.items():
+            if getattr(sprite, 'generation', 0) != generation:
+                continue
+            rect = sprite.rect
+            cx, cy = rect.center
+            if (px, py) == (cx, cy) or abs(cx - px) > max_jump or abs(cy - py) > max_jump:
+                continue
+            self._moved.append((sprite, (cx, cy)))
+            rect.center = (px + (cx - px) * alpha, py + (cy - py) * alpha)
+
+    def end(self) -> None:
+        """Put the sprites back where the simulation left them"""
+        for sprite, center in self._moved:
+            sprite.rect.center = center
+        self._moved.clear()
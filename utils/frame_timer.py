@@ -0,0 +1,130 @@
+import csv
+import time
+from collections import deque
+from typing import Iterable, Optional, TextIO
+from utils.settings import FRAME_STATS_WINDOW
+
+
+class RollingWindow:
+    """
+    The last `window` samples of one timing span (in ms). The running total
+    keeps the mean cheap; percentiles sort the window when asked.
+    """
+    def __init__(self, window: int = FRAME_STATS_WINDOW) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.total = 0.0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, ms: float) -> None:
+        samples = self.samples
+        if len(samples) == samples.maxlen:
+            self.total -= samples[0]
+        samples.append(ms)
+        self.total += ms
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self.samples) if self.samples else 0.0
+
+    @property
+    def max(self) -> float:
+        return max(self.samples, default=0.0)
+
+    def percentile(self, p: float) -> float:
+        """Sample at or below which p percent of the window falls"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def clear(self) -> None:
+        self.samples.clear()
+        self.total = 0.0
+
+
+class FrameTimer:
+    """
+    Wall time spent in each named phase (span) of the game loop.
+    Call begin() at the start of a tick, start() before a span that doesn't
+    follow another one (e.g. rendering), and lap(phase) after each span; a
+    lap is charged the time since the previous lap, begin() or start().
+    Every span feeds a RollingWindow. Laps also add up into the current
+    frame's row, which the game loop closes with end_frame() once per frame
+    and, if a CSV file is open, writes.
+    With keep_samples, every lap is also kept (in ms) for percentiles.
+    """
+    def __init__(self, keep_samples: bool = False, window: int = FRAME_STATS_WINDOW) -> None:
+        self.window = window
+        self.totals: dict[str, float] = {}  # seconds per phase
+        self.windows: dict[str, RollingWindow] = {}
+        self.samples: Optional[dict[str, list[float]]] = {} if keep_samples else None
+        self.ticks = 0
+        self.frames = 0
+        self.frame: dict[str, float] = {}  # ms per phase in the current frame
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        self._last = time.perf_counter()
+
+    def begin(self) -> None:
+        self.ticks += 1
+        self._last = time.perf_counter()
+
+    def start(self) -> None:
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter()
+        elapsed = now - self._last
+        ms = elapsed * 1000
+        self.totals[phase] = self.totals.get(phase, 0.0) + elapsed
+        window = self.windows.get(phase)
+        if window is None:
+            window = self.windows[phase] = RollingWindow(self.window)
+        window.add(ms)
+        self.frame[phase] = self.frame.get(phase, 0.0) + ms
+        if self.samples is not None:
+            self.samples.setdefault(phase, []).append(ms)
+        self._last = now
+
+    def end_frame(self, **counts: float) -> Optional[dict]:
+        """Close the current frame's row (with any extra columns given) and return it"""
+        if not self.frame:
+            # Nothing was timed (e.g. a menu frame), no row
+            return None
+        self.frames += 1
+        row = {'frame': self.frames, 'ticks': self.ticks}
+        row.update((phase, round(ms, 4)) for phase, ms in self.frame.items())
+        row.update(counts)
+        if self._csv_writer:
+            self._csv_writer.writerow(row)
+        self.frame = {}
+        return row
+
+    def open_csv(self, path: str, phases: Iterable[str], counts: Iterable[str] = ()) -> None:
+        """Write every following frame's row to a CSV file at path"""
+        self.close_csv()
+        self._csv_file = open(path, 'w', newline='')
+        self._csv_writer = csv.DictWriter(self._csv_file, ['frame', 'ticks', *phases, *counts], restval=0)
+        self._csv_writer.writeheader()
+
+    def close_csv(self) -> None:
+        if self._csv_file:
+            self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
+
+    def report(self) -> dict[str, float]:
+        """Mean milliseconds per tick for every phase, in the order first seen"""
+        ticks = max(self.ticks, 1)
+        return {phase: total * 1000 / ticks for phase, total in self.totals.items()}
+
+    def reset(self) -> None:
+        self.totals.clear()
+        self.ticks = 0
+        self.frame = {}
+        for window in self.windows.values():
+            window.clear()
+        if self.samples is not None:
+            self.samples.clear()
@@ -0,0 +1,71 @@
+from typing import Generic, Type, TypeVar
+
+T = TypeVar('T')
+
+
+class ObjectPool(Generic[T]):
+    """
+    Free list of reusable instances of one class.
+    Pooled classes initialize themselves in reset(...) (their __init__ just
+    calls it), so acquire() can reinitialize a released instance in place
+    instead of allocating a new one. Each instance remembers its pool in
+    `pool` and should hand itself back through release() when it dies, and
+    gets a new `generation` on every acquire so code holding on to an
+    instance across frames can tell a reused one from the one it saw.
+    """
+    def __init__(self, cls: Type[T], capacity: int, warmup: int = 0) -> None:
+        self.cls = cls
+        self.capacity = capacity
+        self._free: list[T] = []
+        # Counters
+        self.hits = 0        # acquires served from the free list
+        self.misses = 0      # acquires that had to allocate
+        self.in_use = 0
+        self.high_water = 0  # most instances in use at once
+        self.dropped = 0     # releases discarded because the pool was full
+        self.generation = 0  # acquires so far, stamped on each acquired instance
+        self.warm(warmup)
+
+    def warm(self, count: int) -> None:
+        """Preallocate instances until `count` are free (bounded by capacity)."""
+        for _ in range(min(count, self.capacity) - len(self._free)):
+            # Uninitialized shell, reset() fills it on acquire
+            self._free.append(self.cls.__new__(self.cls))
+
+    def acquire(self, *args, **kwargs) -> T:
+        """Return an instance initialized with the given arguments."""
+        if self._free:
+            obj = self._free.pop()
+            self.hits += 1
+        else:
+            obj = self.cls.__new__(self.cls)
+            self.misses += 1
+        obj.reset(*args, **kwargs)
+        obj.pool = self
+        self.generation += 1
+        obj.generation = self.generation
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return obj
+
+    def release(self, obj: T) -> None:
+        """Take back an instance that is no longer used anywhere."""
+        if obj.pool is not self:
+            return
+        obj.pool = None
+        self.in_use -= 1
+        if len(self._free) < self.capacity:
+            self._free.append(obj)
+        else:
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        """Counters as a dict, e.g. for debug overlays."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'in_use': self.in_use,
+            'free': len(self._free),
+            'high_water': self.high_water,
+            'dropped': self.dropped,
+        }
@@ -50,4 +50,61 @@ FAST_ENEMY_HP = 10
 FAST_ENEMY_DAMAGE = 5
 
 # BOSS_SPAWSN_INTERVAL = 300000  # 5 minutes in milliseconds
-BOSS_SPAWN_INTERVAL = 5 *1000
\ No newline at end of file
+BOSS_SPAWN_INTERVAL = 5 *1000
+
+# Sprite transform cache settings
+ROTATION_ANGLE_STEP = 3  # degrees per rotation bucket
+TRANSFORM_CACHE_SIZE = 2048  # max cached rotated/flipped frames
+
+# Texture atlas settings (built by scripts/build_atlas.py)
+ATLAS_MANIFEST = "assets/atlas/manifest.json"
+ATLAS_MAX_SIZE = 1024  # max width/height of a single atlas image
+
+# Text rendering cache
+TEXT_CACHE_SIZE = 512  # max cached text surfaces
+
+# Enemy swarm simulation
+ENEMY_SWARM_CAPACITY = 256  # initial array size, doubled when full
+
+# Enemy status effects
+BURN_TICK_INTERVAL = 500  # ms between burn damage ticks
+
+# Experience orbs
+ORB_MERGE_INTERVAL = 1000  # ms between merge passes
+ORB_MERGE_RADIUS = 24  # orbs within the same cell of this size fuse into one
+ORB_CAP = 300  # hard limit on orbs on the ground, the oldest merge first
+ORB_GRID_CELL_SIZE = 64  # pixels per cell of the orb pickup grid
+ORB_PICKUP_RADIUS = 40  # orbs whose center is this close to the player's are collected
+ORB_MAGNET = False  # pull orbs within ORB_MAGNET_RADIUS towards the player
+ORB_MAGNET_RADIUS = 150
+ORB_MAGNET_SPEED = 6  # pixels per frame
+
+# Projectile integration
+PROJECTILE_STORE_CAPACITY = 256  # initial array size, doubled when full
+
+# Projectile pools (one per projectile class)
+PROJECTILE_POOL_CAPACITY = 512  # max released projectiles kept for reuse
+PROJECTILE_POOL_WARMUP = 64  # instances preallocated when a pool is created
+
+# Collision broadphase
+SPATIAL_HASH_CELL_SIZE = 128  # pixels per grid cell, about one enemy wide
+
+# Simulation loop
+SIM_TICK_RATE = FPS  # fixed simulation steps per second; per-step speeds are tuned for this
+MAX_SIM_STEPS_PER_FRAME = 5  # catch-up limit, time beyond it is dropped
+RENDER_INTERPOLATION = True  # draw sprites between their last two simulated positions
+SIM_CLOCK_MODE = 'fixed'  # 'fixed' (one step per tick, deterministic), 'accelerated' or 'real_time'
+SIM_CLOCK_SPEED = 1.0  # time multiplier in accelerated mode
+
+# Frame timing instrumentation
+FRAME_STATS_WINDOW = 300  # samples kept per timing span for the rolling stats
+PERF_OVERLAY_KEY = pygame.K_F3  # toggles the timing overlay
+FRAME_STATS_CSV = None  # path to write one row of phase timings per frame to, e.g. "frame_stats.csv"
+
+# Rendering
+DIRTY_RECT_RENDERING = False  # only redraw the areas that changed while playing
+
+# Render layers, drawn from lowest to highest (experience orbs go below all of them)
+LAYER_PLAYER = 1
+LAYER_ENEMIES = 2
+LAYER_PROJECTILES = 3
@@ -0,0 +1,63 @@
+import pygame
+from utils.settings import SIM_TICK_RATE, SIM_CLOCK_MODE, SIM_CLOCK_SPEED
+
+
+class SimClock:
+    """
+    Game time in milliseconds, read once per simulation tick.
+    Timers (cooldowns, animations, lifetimes, status effects) read `now`
+    instead of calling pygame.time.get_ticks() themselves, so every entity
+    sees the same time during a tick and the time source can be swapped:
+      - fixed (the default): now advances exactly one step per tick,
+        whatever the wall clock says. The game loop already paces ticks to
+        wall time, and this keeps timers in step with movement when catch-up
+        steps run in one frame or the spiral guard drops time; it also
+        makes runs deterministic
+      - accelerated: like fixed, but frame_time() scales wall time by
+        `speed` so the game loop runs that many times more steps
+      - real_time: now follows pygame.time.get_ticks(), for code driven
+        outside the fixed-step loop
+    """
+    REAL_TIME = 'real_time'
+    FIXED = 'fixed'
+    ACCELERATED = 'accelerated'
+    MODES = (REAL_TIME, FIXED, ACCELERATED)
+
+    def __init__(self, mode: str = SIM_CLOCK_MODE, step_ms: float = 1000 / SIM_TICK_RATE,
+                 speed: float = SIM_CLOCK_SPEED) -> None:
+        self.configure(mode, step_ms, speed)
+
+    def configure(self, mode: str, step_ms: float = 1000 / SIM_TICK_RATE, speed: float = 1.0,
+                  start: int = 0) -> None:
+        """Switch the time source and restart the clock at start (unless real-time)"""
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown clock mode {mode!r}, expected one of {self.MODES}")
+        self.mode = mode
+        self.step_ms = step_ms
+        self.speed = speed
+        self.start = start
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart the clock, e.g. for a new run"""
+        self.ticks = 0
+        self._time = float(self.start)
+        self.now = pygame.time.get_ticks() if self.mode == self.REAL_TIME else self.start
+
+    def tick(self) -> int:
+        """Advance to the next simulation tick and return the new time"""
+        self.ticks += 1
+        if self.mode == self.REAL_TIME:
+            self.now = pygame.time.get_ticks()
+        else:
+            self._time += self.step_ms
+            self.now = int(self._time)
+        return self.now
+
+    def frame_time(self, frame_ms: float) -> float:
+        """Simulation time a rendered frame of frame_ms should account for"""
+        return frame_ms * self.speed if self.mode == self.ACCELERATED else frame_ms
+
+
+# Shared clock every timer reads; the game loop ticks it
+sim_clock = SimClock()
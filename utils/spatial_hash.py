@@ -0,0 +1,209 @@
+import heapq
+import math
+import pygame
+from typing import Callable, Container, Iterable, Optional, Tuple
+from utils.settings import SPATIAL_HASH_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Uniform grid over sprite rects, used as a broadphase for collision queries.
+    Each sprite is stored in every cell its rect overlaps; queries only look at
+    the cells around the searched area and return sprites in insertion order,
+    so results match a linear scan over the original group.
+    """
+    def __init__(self, cell_size: int = SPATIAL_HASH_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[Tuple[int, int], list[pygame.sprite.Sprite]] = {}
+        self._order: dict[pygame.sprite.Sprite, int] = {}
+        self._next_order = 0
+        # Occupied cell range as (min_cx, min_cy, max_cx, max_cy)
+        self._extent: Optional[Tuple[int, int, int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def clear(self) -> None:
+        """Remove every sprite from the grid."""
+        self._cells.clear()
+        self._order.clear()
+        self._next_order = 0
+        self._extent = None
+
+    def rebuild(self, sprites: Iterable[pygame.sprite.Sprite]) -> None:
+        """Refill the grid from the current rects of the given sprites."""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def _cell_range(self, rect: pygame.Rect) -> Tuple[range, range]:
+        size = self.cell_size
+        return (range(rect.left // size, (rect.right - 1) // size + 1),
+                range(rect.top // size, (rect.bottom - 1) // size + 1))
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        """Add a sprite to every cell its rect overlaps."""
+        if sprite in self._order:
+            return
+        self._order[sprite] = self._next_order
+        self._next_order += 1
+        columns, rows = self._cell_range(sprite.rect)
+        for cx in columns:
+            for cy in rows:
+                self._cells.setdefault((cx, cy), []).append(sprite)
+        if columns and rows:
+            extent = (columns[0], rows[0], columns[-1], rows[-1])
+            if self._extent is not None:
+                extent = (min(extent[0], self._extent[0]), min(extent[1], self._extent[1]),
+                          max(extent[2], self._extent[2]), max(extent[3], self._extent[3]))
+            self._extent = extent
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        """
+        Take a sprite out of the grid. Its rect must not have changed since it
+        was inserted; to move a sprite, remove it, move it, then insert it again.
+        The occupied extent only ever grows until the next clear.
+        """
+        if self._order.pop(sprite, None) is None:
+            return
+        columns, rows = self._cell_range(sprite.rect)
+        for cx in columns:
+            for cy in rows:
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    cell.remove(sprite)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+
+    def _candidates(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Sprites sharing a cell with rect, without duplicates, in insertion order."""
+        found = set()
+        columns, rows = self._cell_range(rect)
+        for cx in columns:
+            for cy in rows:
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return sorted(found, key=self._order.__getitem__)
+
+    def query_rect(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Sprites whose rect overlaps the given rect."""
+        return [sprite for sprite in self._candidates(rect) if sprite.rect.colliderect(rect)]
+
+    def query_radius(self, center: Tuple[float, float], radius: float) -> list[pygame.sprite.Sprite]:
+        """Sprites whose rect center lies within radius of the given point."""
+        x, y = center
+        left, top = math.floor(x - radius), math.floor(y - radius)
+        area = pygame.Rect(left, top, math.ceil(x + radius) - left + 1, math.ceil(y + radius) - top + 1)
+        radius_sq = radius * radius
+        return [
+            sprite for sprite in self._candidates(area)
+            if (sprite.rect.centerx - x) ** 2 + (sprite.rect.centery - y) ** 2 <= radius_sq
+        ]
+
+    def nearest(self, point: Tuple[float, float], k: int = 1,
+                accept: Optional[Callable[[pygame.sprite.Sprite], bool]] = None) -> list[pygame.sprite.Sprite]:
+        """
+        Up to k sprites closest to point (by rect center), nearest first.
+        Cells are searched in growing rings around the point and the search
+        stops once no unvisited ring can hold anything closer. Ties go to the
+        sprite inserted first, like a linear scan with a strict comparison.
+        """
+        if self._extent is None or k <= 0:
+            return []
+        x, y = point
+        size = self.cell_size
+        px, py = math.floor(x) // size, math.floor(y) // size
+        # Ring beyond which there are no cells at all
+        min_cx, min_cy, max_cx, max_cy = self._extent
+        max_ring = max(abs(min_cx - px), abs(max_cx - px), abs(min_cy - py), abs(max_cy - py))
+
+        best: dict[pygame.sprite.Sprite, Tuple[float, int]] = {}
+        for ring in range(max_ring + 1):
+            for cell in self._ring_cells(px, py, ring):
+                for sprite in self._cells.get(cell, ()):
+                    if sprite in best or (accept is not None and not accept(sprite)):
+                        continue
+                    dx = sprite.rect.centerx - x
+                    dy = sprite.rect.centery - y
+                    best[sprite] = (dx * dx + dy * dy, self._order[sprite])
+            # Anything in the next ring is at least ring * size away
+            if len(best) >= k:
+                found = heapq.nsmallest(k, best, key=best.__getitem__)
+                if best[found[-1]][0] <= (ring * size) ** 2:
+                    return found
+        return heapq.nsmallest(k, best, key=best.__getitem__)
+
+    @staticmethod
+    def _ring_cells(px: int, py: int, ring: int) -> Iterable[Tuple[int, int]]:
+        """Cells at exactly `ring` cells (Chebyshev distance) from (px, py)."""
+        if ring == 0:
+            yield (px, py)
+            return
+        for cx in range(px - ring, px + ring + 1):
+            yield (cx, py - ring)
+            yield (cx, py + ring)
+        for cy in range(py - ring + 1, py + ring):
+            yield (px - ring, cy)
+            yield (px + ring, cy)
+
+
+class IndexedGroup(pygame.sprite.Group):
+    """
+    Sprite group with a lazily built SpatialHash over its members, shared by
+    every nearest/area query until the owner calls invalidate_index (once per
+    tick, after the sprites moved). Sprites added in between mark the index
+    stale; killed sprites are skipped by membership checks.
+    """
+    def __init__(self, *sprites, cell_size: int = SPATIAL_HASH_CELL_SIZE) -> None:
+        self._index = SpatialHash(cell_size)
+        self._index_valid = False
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        self._index_valid = False
+
+    def invalidate_index(self) -> None:
+        """Rebuild the index on the next query (call after sprites moved)."""
+        self._index_valid = False
+
+    @property
+    def index(self) -> SpatialHash:
+        """Spatial index matching the current rects of the group members."""
+        if not self._index_valid:
+            self._index.rebuild(self)
+            self._index_valid = True
+        return self._index
+
+    def nearest(self, point: Tuple[float, float], exclude: Container = ()) -> Optional[pygame.sprite.Sprite]:
+        """Closest member to point, or None if the group is empty."""
+        found = self.k_nearest(point, 1, exclude)
+        return found[0] if found else None
+
+    def k_nearest(self, point: Tuple[float, float], k: int, exclude: Container = ()) -> list[pygame.sprite.Sprite]:
+        """Up to k members closest to point, nearest first."""
+        return self.index.nearest(
+            point, k, accept=lambda sprite: sprite in self.spritedict and sprite not in exclude
+        )
+
+
+def nearest_sprite(sprites: Iterable[pygame.sprite.Sprite], point: Tuple[float, float],
+                   exclude: Container = ()) -> Optional[pygame.sprite.Sprite]:
+    """
+    Closest sprite to point by rect center. Uses the spatial index of an
+    IndexedGroup and falls back to a linear scan for plain groups and lists.
+    """
+    if isinstance(sprites, IndexedGroup):
+        return sprites.nearest(point, exclude)
+    x, y = point
+    closest = None
+    min_distance = float('inf')
+    for sprite in sprites:
+        if sprite in exclude:
+            continue
+        distance = math.hypot(sprite.rect.centerx - x, sprite.rect.centery - y)
+        if distance < min_distance:
+            min_distance = distance
+            closest = sprite
+    return closest
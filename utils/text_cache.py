@@ -0,0 +1,53 @@
+import pygame
+from collections import OrderedDict
+from typing import Optional, Tuple
+from utils.settings import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    Shared LRU cache of rendered text surfaces, used by the HUD and menus.
+    Only strings that actually changed since they were last drawn get
+    rasterized again.
+    """
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self._fonts: dict[tuple[Optional[str], int], pygame.font.Font] = {}
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size: int, font_name: Optional[str] = None) -> pygame.font.Font:
+        """Return a shared font object, loading it on first use."""
+        key = (font_name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(font_name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text: str, size: int, color: Tuple[int, int, int], antialias: bool = True, font_name: Optional[str] = None) -> pygame.Surface:
+        """Render text with the given font size and color, reusing a cached surface when possible."""
+        key = (font_name, size, text, tuple(color), antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(size, font_name).render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """Drop every cached surface and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared instance used by the HUD and menus
+text_cache = TextCache()
@@ -0,0 +1,59 @@
+import pygame
+from collections import OrderedDict
+from typing import Optional
+from utils.settings import ROTATION_ANGLE_STEP, TRANSFORM_CACHE_SIZE
+
+
+class TransformCache:
+    """
+    Bounded LRU cache of rotated and flipped animation frames.
+    Angles are snapped to buckets of `angle_step` degrees so entities facing
+    almost the same direction share a single rotated surface.
+    """
+    def __init__(self, max_size: int = TRANSFORM_CACHE_SIZE, angle_step: float = ROTATION_ANGLE_STEP) -> None:
+        self.max_size = max_size
+        self.angle_step = angle_step
+        self._entries: OrderedDict[tuple, tuple[pygame.Surface, pygame.Surface]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, angle: float) -> float:
+        """Snap an angle to its bucket, normalized to [0, 360)."""
+        if self.angle_step > 0:
+            angle = round(angle / self.angle_step) * self.angle_step
+        return angle % 360
+
+    def get(self, frame: pygame.Surface, angle: Optional[float] = None, flip: bool = False) -> pygame.Surface:
+        """Return `frame` flipped horizontally (if asked) and then rotated by `angle`."""
+        bucket = None if angle is None else self.quantize(angle)
+        if bucket is None and not flip:
+            return frame
+
+        key = (id(frame), bucket, flip)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        image = frame
+        if flip:
+            image = pygame.transform.flip(image, True, False)
+        if bucket:
+            image = pygame.transform.rotate(image, bucket)
+        # Keep the source frame alive so its id cannot be reused by another surface
+        self._entries[key] = (frame, image)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return image
+
+    def clear(self) -> None:
+        """Drop every cached surface and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared instance used by every animated sprite
+transform_cache = TransformCache()